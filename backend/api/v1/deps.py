@@ -0,0 +1,38 @@
+"""Shared service dependencies for the API endpoints."""
+from functools import lru_cache
+
+from backend.services.data_service import DataService
+from backend.services.market_service import MarketService
+from backend.services.pricing_service import PricingService
+from backend.services.smile_service import SmileService
+from backend.services.surface_service import SurfaceService
+
+
+@lru_cache(maxsize=None)
+def get_pricing_service() -> PricingService:
+    """Process-wide pricing service (its Numba kernels are compiled at import)."""
+    return PricingService()
+
+
+@lru_cache(maxsize=None)
+def get_data_service() -> DataService:
+    """Process-wide option chain data service."""
+    return DataService()
+
+
+@lru_cache(maxsize=None)
+def get_surface_service() -> SurfaceService:
+    """Process-wide volatility surface service."""
+    return SurfaceService()
+
+
+@lru_cache(maxsize=None)
+def get_market_service() -> MarketService:
+    """Process-wide market data service."""
+    return MarketService()
+
+
+@lru_cache(maxsize=None)
+def get_smile_service() -> SmileService:
+    """Process-wide volatility smile service."""
+    return SmileService()
@@ -1,5 +1,9 @@
 """Data fetching endpoints."""
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi_cache.decorator import cache
+from backend.core.config import settings
+from backend.api.v1.deps import get_data_service
 from backend.schemas.data import (
     OptionChainRequest,
     OptionChainResponse,
@@ -8,18 +12,19 @@ from backend.schemas.data import (
 from backend.services.data_service import DataService
 
 router = APIRouter()
-data_service = DataService()
 
 
 @router.post("/option-chain", response_model=OptionChainResponse, tags=["Data"])
-async def get_option_chain(request: OptionChainRequest):
+async def get_option_chain(
+    request: OptionChainRequest, data_service: DataService = Depends(get_data_service)
+):
     """
     Fetch option chain data for a given symbol and expiration.
 
     Returns all call and put contracts with strikes, prices, and implied volatilities.
     """
     try:
-        return data_service.get_option_chain(request)
+        return await asyncio.to_thread(data_service.get_option_chain, request)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -29,14 +34,15 @@ async def get_option_chain(request: OptionChainRequest):
 @router.get(
     "/expirations/{symbol}", response_model=AvailableExpirationsResponse, tags=["Data"]
 )
-async def get_expirations(symbol: str):
+@cache(expire=settings.CACHE_TTL_SECONDS)
+async def get_expirations(symbol: str, data_service: DataService = Depends(get_data_service)):
     """
     Get list of available expiration dates for an underlying symbol.
 
     Returns all available option expiration dates.
     """
     try:
-        return data_service.get_available_expirations(symbol)
+        return await asyncio.to_thread(data_service.get_available_expirations, symbol)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
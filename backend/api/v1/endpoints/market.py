@@ -1,5 +1,9 @@
 """Market data endpoints."""
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi_cache.decorator import cache
+from backend.core.config import settings
+from backend.api.v1.deps import get_market_service
 from backend.services.market_service import MarketService
 from backend.schemas.market import MarketOverviewResponse, IndexChartsResponse, OHLCChartResponse
 
@@ -7,30 +11,34 @@ router = APIRouter()
 
 
 @router.get("/overview", response_model=MarketOverviewResponse)
-async def get_market_overview():
+@cache(expire=settings.CACHE_TTL_SECONDS)
+async def get_market_overview(market_service: MarketService = Depends(get_market_service)):
     """Get market overview with indices, stocks, and commodities."""
     try:
-        return MarketService.get_market_overview()
+        return await asyncio.to_thread(market_service.get_market_overview)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/charts", response_model=IndexChartsResponse)
-async def get_index_charts():
+@cache(expire=settings.CACHE_TTL_SECONDS)
+async def get_index_charts(market_service: MarketService = Depends(get_market_service)):
     """Get historical chart data for major indices."""
     try:
-        return MarketService.get_index_charts()
+        return await asyncio.to_thread(market_service.get_index_charts)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/ohlc/{symbol}", response_model=OHLCChartResponse)
+@cache(expire=settings.CACHE_TTL_SECONDS)
 async def get_ohlc_data(
     symbol: str,
-    period: str = Query(default="6mo", description="Time period (e.g., 1mo, 3mo, 6mo, 1y)")
+    period: str = Query(default="6mo", description="Time period (e.g., 1mo, 3mo, 6mo, 1y)"),
+    market_service: MarketService = Depends(get_market_service),
 ):
     """Get OHLC (candlestick) data for a symbol."""
     try:
-        return MarketService.get_ohlc_data(symbol, period)
+        return await asyncio.to_thread(market_service.get_ohlc_data, symbol, period)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
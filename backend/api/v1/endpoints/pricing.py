@@ -1,5 +1,6 @@
 """Pricing and Greeks endpoints."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from backend.api.v1.deps import get_pricing_service
 from backend.schemas.pricing import (
     PricingRequest,
     PricingResponse,
@@ -9,11 +10,12 @@ from backend.schemas.pricing import (
 from backend.services.pricing_service import PricingService
 
 router = APIRouter()
-pricing_service = PricingService()
 
 
 @router.post("/price", response_model=PricingResponse, tags=["Pricing"])
-async def calculate_price(request: PricingRequest):
+async def calculate_price(
+    request: PricingRequest, pricing_service: PricingService = Depends(get_pricing_service)
+):
     """
     Calculate option price using Black-Scholes model.
 
@@ -26,7 +28,9 @@ async def calculate_price(request: PricingRequest):
 
 
 @router.post("/greeks", response_model=GreeksResponse, tags=["Pricing"])
-async def calculate_greeks(request: GreeksRequest):
+async def calculate_greeks(
+    request: GreeksRequest, pricing_service: PricingService = Depends(get_pricing_service)
+):
     """
     Calculate all Greeks (delta, gamma, vega, theta, rho) for an option.
 
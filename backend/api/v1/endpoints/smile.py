@@ -1,5 +1,7 @@
 """Volatility smile endpoints."""
-from fastapi import APIRouter, HTTPException
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from backend.api.v1.deps import get_smile_service
 from backend.services.smile_service import SmileService
 from backend.schemas.smile import VolSmileRequest, VolSmileComparisonResponse
 
@@ -7,9 +9,11 @@ router = APIRouter()
 
 
 @router.post("/compare", response_model=VolSmileComparisonResponse)
-async def get_volatility_smile_comparison(request: VolSmileRequest):
+async def get_volatility_smile_comparison(
+    request: VolSmileRequest, smile_service: SmileService = Depends(get_smile_service)
+):
     """Get volatility smile with market IV vs model-calculated IVs."""
     try:
-        return SmileService.get_volatility_smile_comparison(request)
+        return await asyncio.to_thread(smile_service.get_volatility_smile_comparison, request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
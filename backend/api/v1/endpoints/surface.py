@@ -1,5 +1,7 @@
 """Volatility surface endpoints."""
-from fastapi import APIRouter, HTTPException
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from backend.api.v1.deps import get_surface_service
 from backend.schemas.surface import (
     VolSurfaceRequest,
     VolSurfaceResponse,
@@ -9,11 +11,12 @@ from backend.schemas.surface import (
 from backend.services.surface_service import SurfaceService
 
 router = APIRouter()
-surface_service = SurfaceService()
 
 
 @router.post("/build", response_model=VolSurfaceResponse, tags=["Volatility Surface"])
-async def build_vol_surface(request: VolSurfaceRequest):
+async def build_vol_surface(
+    request: VolSurfaceRequest, surface_service: SurfaceService = Depends(get_surface_service)
+):
     """
     Build a volatility surface from market data.
 
@@ -21,7 +24,7 @@ async def build_vol_surface(request: VolSurfaceRequest):
     a complete volatility surface with strikes, maturities, and implied vols.
     """
     try:
-        return surface_service.build_vol_surface(request)
+        return await asyncio.to_thread(surface_service.build_vol_surface, request)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -29,7 +32,9 @@ async def build_vol_surface(request: VolSurfaceRequest):
 
 
 @router.post("/smile", response_model=VolSmileResponse, tags=["Volatility Surface"])
-async def get_vol_smile(request: VolSmileRequest):
+async def get_vol_smile(
+    request: VolSmileRequest, surface_service: SurfaceService = Depends(get_surface_service)
+):
     """
     Get volatility smile for a specific expiration date.
 
@@ -37,7 +42,7 @@ async def get_vol_smile(request: VolSmileRequest):
     showing the characteristic smile/skew pattern.
     """
     try:
-        return surface_service.get_vol_smile(request)
+        return await asyncio.to_thread(surface_service.get_vol_smile, request)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -1,6 +1,6 @@
 """Backend configuration using environment variables."""
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     # Cache Configuration
     ENABLE_CACHE: bool = True
     CACHE_TTL_SECONDS: int = 300  # 5 minutes
+    REDIS_URL: Optional[str] = None  # Shared cache backend; in-memory when unset
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,43 @@
+"""Expiration date helpers shared by the request schemas and services."""
+from datetime import date, datetime
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+def parse_iso_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD date string.
+
+    Fixed-offset slicing instead of datetime.strptime, which re-interprets the
+    format string on every call.
+    """
+    if (
+        len(value) != 10
+        or value[4] != "-"
+        or value[7] != "-"
+        or not (value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit())
+    ):
+        raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD")
+    try:
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+    except ValueError:
+        raise ValueError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+def days_to_expiry(expiration: date, now: Optional[datetime] = None) -> int:
+    """Whole days from now until the start of the expiration date."""
+    now = now or datetime.now()
+    return (datetime(expiration.year, expiration.month, expiration.day) - now).days
+
+
+def days_to_expiries(expirations: Sequence[str], now: Optional[datetime] = None) -> np.ndarray:
+    """
+    days_to_expiry for a list of YYYY-MM-DD strings in one pass.
+
+    The strings are parsed by numpy's datetime64 conversion and the day counts
+    floored like timedelta.days.
+    """
+    now = now or datetime.now()
+    dates = np.array(expirations, dtype="datetime64[D]")
+    return (dates - np.datetime64(now, "us")) // np.timedelta64(1, "D")
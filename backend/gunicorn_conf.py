@@ -0,0 +1,22 @@
+"""Gunicorn configuration for serving the API with Uvicorn workers.
+
+Usage: gunicorn backend.main:app -c backend/gunicorn_conf.py
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+
+# Uvicorn workers run uvloop + httptools (from uvicorn[standard]); processes
+# scale the CPU-bound pricing endpoints past the GIL. WEB_CONCURRENCY overrides
+# the default on machines where cpu_count() overstates the container's share.
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+
+# Import the app (and JIT-compile the Numba pricing kernels) once in the master
+# so forked workers start warm
+preload_app = True
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+keepalive = 5
+accesslog = "-"
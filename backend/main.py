@@ -1,10 +1,56 @@
 """FastAPI application entry point."""
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.key_builder import default_key_builder
 from backend.core.config import settings
 from backend.api.v1.api import api_router
 
 
+def _request_key_builder(func, namespace: str = "", *, request: Request = None, response=None,
+                         args=(), kwargs=None) -> str:
+    """
+    Cache key from the endpoint, path and sorted query parameters.
+
+    Injected service singletons are deliberately left out so that keys match
+    across worker processes sharing a Redis backend.
+    """
+    if request is None:
+        return default_key_builder(func, namespace, request=request, response=response,
+                                   args=args, kwargs=kwargs or {})
+    query = sorted(request.query_params.multi_items())
+    return f"{namespace}:{func.__module__}:{func.__name__}:{request.url.path}:{query}"
+
+
+def _init_cache():
+    """Initialize the response cache (Redis when REDIS_URL is set, otherwise in-memory)."""
+    if settings.REDIS_URL:
+        from redis import asyncio as aioredis
+        from fastapi_cache.backends.redis import RedisBackend
+
+        backend = RedisBackend(aioredis.from_url(settings.REDIS_URL))
+    else:
+        backend = InMemoryBackend()
+
+    FastAPICache.init(
+        backend,
+        prefix="options-desk-cache",
+        expire=settings.CACHE_TTL_SECONDS,
+        key_builder=_request_key_builder,
+        enable=settings.ENABLE_CACHE,
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    _init_cache()
+    yield
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
@@ -12,12 +58,13 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url=f"{settings.API_V1_PREFIX}/docs",
     redoc_url=f"{settings.API_V1_PREFIX}/redoc",
+    lifespan=lifespan,
 )
 
-# Configure CORS
+# Configure CORS (a frozenset makes the per-request origin check a hash lookup)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_origins=frozenset(settings.BACKEND_CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
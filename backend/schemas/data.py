@@ -1,7 +1,9 @@
 """Data fetching request/response schemas."""
-from pydantic import BaseModel, Field
+from functools import cached_property
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
-from datetime import datetime
+from datetime import date, datetime
+from backend.core.dates import parse_iso_date
 
 
 class OptionChainRequest(BaseModel):
@@ -12,6 +14,18 @@ class OptionChainRequest(BaseModel):
         None, description="Specific expiration date (YYYY-MM-DD). If None, gets nearest."
     )
 
+    @field_validator("expiration_date")
+    @classmethod
+    def _check_expiration_date(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None:
+            parse_iso_date(value)
+        return value
+
+    @cached_property
+    def expiration(self) -> Optional[date]:
+        """Parsed expiration_date, or None for the nearest expiration."""
+        return parse_iso_date(self.expiration_date) if self.expiration_date else None
+
 
 class OptionContractData(BaseModel):
     """Single option contract data."""
@@ -1,6 +1,9 @@
 """Volatility smile schemas with model comparison."""
-from pydantic import BaseModel, Field
+from datetime import date
+from functools import cached_property
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Literal, Optional
+from backend.core.dates import parse_iso_date
 
 
 class VolSmileRequest(BaseModel):
@@ -29,6 +32,17 @@ class VolSmileRequest(BaseModel):
     merton_mu_j: Optional[float] = Field(default=-0.05, description="Merton mean jump size")
     merton_sigma_j: Optional[float] = Field(default=0.15, description="Merton jump volatility")
 
+    @field_validator("expiration_date")
+    @classmethod
+    def _check_expiration_date(cls, value: str) -> str:
+        parse_iso_date(value)
+        return value
+
+    @cached_property
+    def expiration(self) -> date:
+        """Parsed expiration_date."""
+        return parse_iso_date(self.expiration_date)
+
 
 class VolSmileDataPoint(BaseModel):
     """Single point on volatility smile."""
@@ -1,15 +1,9 @@
 """Volatility surface request/response schemas."""
-from pydantic import BaseModel, Field
+from datetime import date
+from functools import cached_property
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
-
-
-class VolSurfacePoint(BaseModel):
-    """Single point on volatility surface."""
-
-    strike: float
-    expiry: float = Field(..., description="Time to expiration in years")
-    implied_vol: float
-    moneyness: Optional[float] = Field(None, description="Strike/Spot ratio")
+from backend.core.dates import parse_iso_date
 
 
 class VolSurfaceRequest(BaseModel):
@@ -20,15 +14,29 @@ class VolSurfaceRequest(BaseModel):
     min_expiry_days: int = Field(default=7, description="Minimum days to expiration")
     max_expiry_days: int = Field(default=365, description="Maximum days to expiration")
     interpolate: bool = Field(default=False, description="Whether to interpolate the surface")
-    grid_size: int = Field(default=30, description="Grid size for interpolation")
+    grid_size: int = Field(
+        default=30,
+        description=(
+            "Grid size for interpolation "
+            "(capped at about twice the square root of the quote count)"
+        ),
+    )
 
 
 class VolSurfaceResponse(BaseModel):
-    """Response with volatility surface data."""
+    """
+    Response with volatility surface data.
+
+    Points are returned column-wise: the i-th entries of strikes, expiries,
+    implied_vols and moneyness describe one point of the surface.
+    """
 
     symbol: str
     spot_price: float
-    surface_points: List[VolSurfacePoint]
+    strikes: List[float]
+    expiries: List[float] = Field(..., description="Time to expiration in years")
+    implied_vols: List[float]
+    moneyness: List[float] = Field(..., description="Strike/Spot ratio")
     num_expirations: int
     num_strikes: int
 
@@ -39,6 +47,17 @@ class VolSmileRequest(BaseModel):
     symbol: str
     expiration_date: str = Field(..., description="Target expiration date (YYYY-MM-DD)")
 
+    @field_validator("expiration_date")
+    @classmethod
+    def _check_expiration_date(cls, value: str) -> str:
+        parse_iso_date(value)
+        return value
+
+    @cached_property
+    def expiration(self) -> date:
+        """Parsed expiration_date."""
+        return parse_iso_date(self.expiration_date)
+
 
 class VolSmileResponse(BaseModel):
     """Response with volatility smile."""
@@ -1,10 +1,45 @@
 """Advanced pricing models (Heston, SABR, Merton)."""
+import math
+from functools import lru_cache
 import numpy as np
-from scipy.stats import norm
-from scipy.integrate import quad
-from scipy.optimize import brentq
+from numba import njit
+from scipy.special import gammaln, ndtr, xlogy
+from scipy.interpolate import CubicSpline
 from typing import Literal
 
+from options_desk.pricer import black_scholes_implied_vol
+
+
+@njit(cache=True)
+def _heston_cf(phi, S, T, r, v0, theta, kappa, sigma_v, rho, j):
+    """Heston characteristic function f_j(phi) for the P1 / P2 integrals; phi may be an array."""
+    if j == 1:
+        u, b = 0.5, kappa - rho * sigma_v
+    else:
+        u, b = -0.5, kappa
+
+    a = kappa * theta
+    x = math.log(S)
+    iphi = 1j * phi
+
+    # 'Little Heston trap' form: g and the exponentials use -d, which keeps the
+    # complex log on its principal branch for long expiries
+    beta = b - rho * sigma_v * iphi
+    d = np.sqrt(beta**2 - sigma_v**2 * (2 * u * iphi - phi**2))
+    g = (beta - d) / (beta + d)
+    exp_mdT = np.exp(-d * T)
+
+    C = r * iphi * T + (a / sigma_v**2) * (
+        (beta - d) * T - 2 * np.log((1 - g * exp_mdT) / (1 - g))
+    )
+    D = ((beta - d) / sigma_v**2) * ((1 - exp_mdT) / (1 - g * exp_mdT))
+
+    return np.exp(C + D * v0 + iphi * x)
+
+
+# Gauss-Legendre rule for the Heston probability integrals, remapped per call
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(64)
+
 
 class HestonModel:
     """Heston stochastic volatility model implementation."""
@@ -35,62 +70,214 @@ class HestonModel:
         if time_to_expiry <= 0:
             return max(0, spot - strike) if option_type == "call" else max(0, strike - spot)
 
-        # Use semi-analytical formula via Fourier inversion
-        P1 = HestonModel._heston_probability(
-            spot, strike, time_to_expiry, rate, v0, theta, kappa, sigma_v, rho, 1
+        # Repeated quotes (same chart, same parameters) are served from the cache
+        args = (spot, strike, time_to_expiry, rate, v0, theta, kappa, sigma_v, rho)
+        return _heston_price_cached(
+            *(round(float(x), _PRICE_CACHE_DIGITS) for x in args), option_type == "call"
         )
-        P2 = HestonModel._heston_probability(
-            spot, strike, time_to_expiry, rate, v0, theta, kappa, sigma_v, rho, 2
+
+    @staticmethod
+    def price_vec(
+        spot: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        rate: float,
+        v0: float,
+        theta: float,
+        kappa: float,
+        sigma_v: float,
+        rho: float,
+        option_type: Literal["call", "put"] = "call",
+    ) -> np.ndarray:
+        """
+        Heston prices for a strike vector by direct Fourier inversion.
+
+        Both characteristic functions are evaluated once on the quadrature
+        nodes; each strike then only adds its exp(-i phi log K) factor and a
+        dot product with the weights.
+        """
+        strikes = np.asarray(strikes, dtype=np.float64)
+        T = time_to_expiry
+        if T <= 0:
+            payoff = spot - strikes if option_type == "call" else strikes - spot
+            return np.maximum(payoff, 0.0)
+
+        # Use semi-analytical formula via Fourier inversion
+        P1, P2 = HestonModel._heston_probabilities(
+            spot, strikes, T, rate, v0, theta, kappa, sigma_v, rho
         )
 
+        discount = np.exp(-rate * T)
         if option_type == "call":
-            price = spot * P1 - strike * np.exp(-rate * time_to_expiry) * P2
+            prices = spot * P1 - strikes * discount * P2
         else:
-            price = strike * np.exp(-rate * time_to_expiry) * (1 - P2) - spot * (1 - P1)
+            prices = strikes * discount * (1 - P2) - spot * (1 - P1)
 
-        return max(0, price)
+        return np.maximum(prices, 0.0)
 
     @staticmethod
-    def _heston_probability(spot, strike, T, r, v0, theta, kappa, sigma_v, rho, j):
-        """Calculate probability Pj using Fourier inversion."""
-
-        def integrand(phi):
-            return np.real(
-                np.exp(-1j * phi * np.log(strike)) *
-                HestonModel._characteristic_function(phi, spot, T, r, v0, theta, kappa, sigma_v, rho, j) /
-                (1j * phi)
-            )
-
-        try:
-            integral, _ = quad(integrand, 0, 100, limit=100)
-            return 0.5 + (1 / np.pi) * integral
-        except:
-            return 0.5  # Fallback
+    def _heston_probabilities(spot, strikes, T, r, v0, theta, kappa, sigma_v, rho):
+        """
+        Calculate probabilities P1 and P2 for every strike using Fourier inversion.
+
+        The integrand decays like exp(-v0 T phi^2 / 2) near the origin and like
+        exp(-sqrt(1 - rho^2) (v0 + kappa theta T) phi / sigma_v) in the tail, so
+        the integral is truncated where both bounds are negligible (capped at
+        100) and evaluated with one 64-point Gauss-Legendre rule.
+        """
+        gauss_cut = 10.0 / np.sqrt(max(v0 * T, 1e-4))
+        tail_rate = np.sqrt(max(1.0 - rho**2, 0.0)) * (v0 + kappa * theta * T) / max(sigma_v, 1e-8)
+        phi_max = min(100.0, max(gauss_cut, 20.0 / max(tail_rate, 0.2)))
+        phi = 0.5 * phi_max * (_GL_NODES + 1.0)
+
+        # Re(exp(-i phi log K) (c + i d)) = c cos(phi log K) + d sin(phi log K): the
+        # (nodes x strikes) part is two real matrices shared by P1 and P2, and
+        # only the per-node characteristic function values are complex
+        angle = np.outer(phi, np.log(strikes))
+        cos_angle, sin_angle = np.cos(angle), np.sin(angle)
+        weights = 0.5 * phi_max * _GL_WEIGHTS
+
+        probabilities = []
+        for j in (1, 2):
+            cf = _heston_cf(phi, spot, T, r, v0, theta, kappa, sigma_v, rho, j) / (1j * phi)
+            integral = (weights * cf.real) @ cos_angle + (weights * cf.imag) @ sin_angle
+            # Fallback where the integral broke down
+            probabilities.append(np.where(np.isfinite(integral), 0.5 + integral / np.pi, 0.5))
+        return probabilities
 
     @staticmethod
     def _characteristic_function(phi, S, T, r, v0, theta, kappa, sigma_v, rho, j):
         """Heston characteristic function."""
-        if j == 1:
-            u, b = 0.5, kappa - rho * sigma_v
-        else:
-            u, b = -0.5, kappa
+        return _heston_cf(phi, S, T, r, v0, theta, kappa, sigma_v, rho, j)
+
+    @staticmethod
+    def price_fft(
+        spot: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        rate: float,
+        v0: float,
+        theta: float,
+        kappa: float,
+        sigma_v: float,
+        rho: float,
+        n: int = 2**14,
+        alpha: float = 1.5,
+        eta: float = 0.25,
+    ) -> np.ndarray:
+        """
+        Heston call prices for a whole strike vector via the Carr-Madan FFT.
+
+        One FFT of the damped call transform
 
-        a = kappa * theta
-        x = np.log(S)
+            psi(v) = exp(-rT) phi(v - (alpha + 1)i) / (alpha^2 + alpha - v^2 + i(2 alpha + 1) v)
+
+        gives prices on a log-strike grid of spacing 2 pi / (n eta) centred on
+        log(spot); a cubic spline over the grid nodes spanning the quoted strikes
+        then evaluates each strike (linear interpolation on this grid is off by
+        up to ~1e-3 near the money for short expiries).
+        """
+        strikes = np.asarray(strikes, dtype=np.float64)
+        if time_to_expiry <= 0:
+            return np.maximum(spot - strikes, 0.0)
 
-        d = np.sqrt((rho * sigma_v * 1j * phi - b)**2 - sigma_v**2 * (2 * u * 1j * phi - phi**2))
-        g = (b - rho * sigma_v * 1j * phi + d) / (b - rho * sigma_v * 1j * phi - d)
+        v = np.arange(n) * eta
+        lam = 2.0 * np.pi / (n * eta)
+        k_start = np.log(spot) - 0.5 * n * lam
+        log_strikes = k_start + np.arange(n) * lam
 
-        C = r * 1j * phi * T + (a / sigma_v**2) * (
-            (b - rho * sigma_v * 1j * phi + d) * T -
-            2 * np.log((1 - g * np.exp(d * T)) / (1 - g))
+        cf = HestonModel._log_price_cf(
+            v - (alpha + 1.0) * 1j, spot, time_to_expiry, rate, v0, theta, kappa, sigma_v, rho
         )
+        psi = np.exp(-rate * time_to_expiry) * cf / (
+            alpha**2 + alpha - v**2 + 1j * (2.0 * alpha + 1.0) * v
+        )
+
+        # Simpson weights
+        weights = np.full(n, 2.0)
+        weights[1::2] = 4.0
+        weights[0] = weights[-1] = 1.0
+        weights *= eta / 3.0
+
+        fft = np.fft.fft(np.exp(-1j * v * k_start) * psi * weights)
+        calls = np.exp(-alpha * log_strikes) * fft.real / np.pi
 
-        D = ((b - rho * sigma_v * 1j * phi + d) / sigma_v**2) * (
-            (1 - np.exp(d * T)) / (1 - g * np.exp(d * T))
+        target = np.log(strikes)
+        lo = max(int(np.searchsorted(log_strikes, target.min())) - 4, 0)
+        hi = min(int(np.searchsorted(log_strikes, target.max())) + 4, n)
+        spline = CubicSpline(log_strikes[lo:hi], calls[lo:hi])
+        return np.maximum(spline(target), 0.0)
+
+    @staticmethod
+    def _log_price_cf(u, S, T, r, v0, theta, kappa, sigma_v, rho):
+        """
+        Characteristic function of log(S_T), vectorized over complex u.
+
+        Uses the 'little Heston trap' form (Albrecher et al.), which stays on the
+        principal branch of the complex log for the long grids the FFT needs.
+        """
+        iu = 1j * u
+        beta = kappa - rho * sigma_v * iu
+        d = np.sqrt(beta**2 + sigma_v**2 * (iu + u**2))
+        g = (beta - d) / (beta + d)
+        exp_dt = np.exp(-d * T)
+
+        C = r * iu * T + (kappa * theta / sigma_v**2) * (
+            (beta - d) * T - 2.0 * np.log((1.0 - g * exp_dt) / (1.0 - g))
         )
+        D = ((beta - d) / sigma_v**2) * ((1.0 - exp_dt) / (1.0 - g * exp_dt))
+
+        return np.exp(C + D * v0 + iu * np.log(S))
+
+
+# Heston inputs are rounded to this many decimals before the price cache lookup
+_PRICE_CACHE_DIGITS = 6
 
-        return np.exp(C + D * v0 + 1j * phi * x)
+
+@lru_cache(maxsize=4096)
+def _heston_price_cached(spot, strike, T, r, v0, theta, kappa, sigma_v, rho, is_call):
+    """Memoized single-strike Heston price; arguments are pre-rounded floats."""
+    option_type = "call" if is_call else "put"
+    return float(HestonModel.price_vec(
+        spot, [strike], T, r, v0, theta, kappa, sigma_v, rho, option_type
+    )[0])
+
+
+@njit(cache=True)
+def _sabr_iv(forward, strike, T, alpha, beta, rho, nu):
+    """Hagan (2002) SABR lognormal implied volatility for one strike."""
+    if T <= 0 or alpha <= 0:
+        return 0.0
+
+    fk_mid = (forward * strike) ** ((1 - beta) / 2)
+    term2 = 1 + ((((1 - beta)**2 / 24) * (alpha**2 / fk_mid**2) +
+                  (rho * beta * nu * alpha / (4 * fk_mid)) +
+                  ((2 - 3 * rho**2) / 24) * nu**2) * T)
+
+    if abs(forward - strike) < 1e-10:  # ATM case
+        return alpha / fk_mid * term2
+
+    # General case
+    log_fk = math.log(forward / strike)
+    z = (nu / alpha) * fk_mid * log_fk
+    if abs(z) < 1e-5:
+        x_z = 1.0
+    else:
+        x_z = z / math.log((math.sqrt(1 - 2 * rho * z + z**2) + z - rho) / (1 - rho))
+
+    term1 = alpha / (fk_mid * (1 + ((1 - beta)**2 / 24) * log_fk**2 +
+                                ((1 - beta)**4 / 1920) * log_fk**4))
+
+    return term1 * x_z * term2
+
+
+@njit(cache=True)
+def _sabr_iv_vec(forward, strikes, T, alpha, beta, rho, nu):
+    """_sabr_iv over a strike array in one compiled loop."""
+    out = np.empty(strikes.shape[0])
+    for i in range(strikes.shape[0]):
+        out[i] = _sabr_iv(forward, strikes[i], T, alpha, beta, rho, nu)
+    return out
 
 
 class SABRModel:
@@ -115,37 +302,27 @@ class SABRModel:
         - rho: correlation between forward and volatility
         - nu: volatility of volatility
         """
-        if time_to_expiry <= 0 or alpha <= 0:
-            return 0.0
-
-        if abs(forward - strike) < 1e-10:  # ATM case
-            fk_mid = (forward * strike) ** ((1 - beta) / 2)
-            term1 = alpha / fk_mid
-            term2 = 1 + ((((1 - beta)**2 / 24) * (alpha**2 / fk_mid**2) +
-                          (rho * beta * nu * alpha / (4 * fk_mid)) +
-                          ((2 - 3 * rho**2) / 24) * nu**2) * time_to_expiry)
-            return term1 * term2
-
-        # General case
-        fk_mid = (forward * strike) ** ((1 - beta) / 2)
-        log_fk = np.log(forward / strike)
-
-        z = (nu / alpha) * fk_mid * log_fk
-        x_z = np.log((np.sqrt(1 - 2 * rho * z + z**2) + z - rho) / (1 - rho))
-
-        if abs(z) < 1e-5:
-            x_z = 1
-        else:
-            x_z = z / x_z
-
-        term1 = alpha / (fk_mid * (1 + ((1 - beta)**2 / 24) * log_fk**2 +
-                                    ((1 - beta)**4 / 1920) * log_fk**4))
-
-        term2 = 1 + ((((1 - beta)**2 / 24) * (alpha**2 / fk_mid**2) +
-                      (rho * beta * nu * alpha / (4 * fk_mid)) +
-                      ((2 - 3 * rho**2) / 24) * nu**2) * time_to_expiry)
+        return _sabr_iv(
+            float(forward), float(strike), float(time_to_expiry),
+            float(alpha), float(beta), float(rho), float(nu),
+        )
 
-        return term1 * x_z * term2
+    @staticmethod
+    def implied_volatility_vec(
+        forward: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        alpha: float,
+        beta: float,
+        rho: float,
+        nu: float,
+    ) -> np.ndarray:
+        """Hagan (2002) SABR implied volatility for a whole strike vector (compiled loop)."""
+        strikes = np.ascontiguousarray(strikes, dtype=np.float64)
+        return _sabr_iv_vec(
+            float(forward), strikes.ravel(), float(time_to_expiry),
+            float(alpha), float(beta), float(rho), float(nu),
+        ).reshape(strikes.shape)
 
 
 class MertonJumpDiffusion:
@@ -181,34 +358,96 @@ class MertonJumpDiffusion:
         price = 0.0
         lambda_prime = lambda_j * (1 + mu_j)
 
-        for n in range(max_jumps):
-            # Probability of n jumps
-            poisson_prob = np.exp(-lambda_prime * time_to_expiry) * \
-                           (lambda_prime * time_to_expiry)**n / np.math.factorial(n)
+        # Probabilities of the jump counts that matter, computed in log space
+        jumps, poisson_probs = _poisson_weights(lambda_prime * time_to_expiry, max_jumps)
 
-            if poisson_prob < 1e-10:
-                break
+        # Loop invariants
+        log1p_mu = math.log1p(mu_j)
+        sqrt_T = math.sqrt(time_to_expiry)
+        log_SK = math.log(spot / strike)
+        discount = math.exp(-rate * time_to_expiry)
 
+        for n, poisson_prob in zip(jumps.tolist(), poisson_probs.tolist()):
             # Adjusted parameters for n jumps
-            sigma_n = np.sqrt(sigma**2 + n * sigma_j**2 / time_to_expiry)
-            r_n = rate - lambda_j * mu_j + n * np.log(1 + mu_j) / time_to_expiry
+            sigma_n = math.sqrt(sigma**2 + n * sigma_j**2 / time_to_expiry)
+            r_n = rate - lambda_j * mu_j + n * log1p_mu / time_to_expiry
 
             # Black-Scholes price with adjusted parameters
-            d1 = (np.log(spot / strike) + (r_n + 0.5 * sigma_n**2) * time_to_expiry) / \
-                 (sigma_n * np.sqrt(time_to_expiry))
-            d2 = d1 - sigma_n * np.sqrt(time_to_expiry)
+            d1 = (log_SK + (r_n + 0.5 * sigma_n**2) * time_to_expiry) / (sigma_n * sqrt_T)
+            d2 = d1 - sigma_n * sqrt_T
 
             if option_type == "call":
-                bs_price = spot * np.exp((r_n - rate) * time_to_expiry) * norm.cdf(d1) - \
-                           strike * np.exp(-rate * time_to_expiry) * norm.cdf(d2)
+                bs_price = spot * math.exp((r_n - rate) * time_to_expiry) * ndtr(d1) - \
+                           strike * discount * ndtr(d2)
             else:
-                bs_price = strike * np.exp(-rate * time_to_expiry) * norm.cdf(-d2) - \
-                           spot * np.exp((r_n - rate) * time_to_expiry) * norm.cdf(-d1)
+                bs_price = strike * discount * ndtr(-d2) - \
+                           spot * math.exp((r_n - rate) * time_to_expiry) * ndtr(-d1)
 
             price += poisson_prob * bs_price
 
         return max(0, price)
 
+    @staticmethod
+    def price_vec(
+        spot: float,
+        strikes: np.ndarray,
+        time_to_expiry: float,
+        rate: float,
+        sigma: float,
+        lambda_j: float,
+        mu_j: float,
+        sigma_j: float,
+        option_type: Literal["call", "put"] = "call",
+        max_jumps: int = 50,
+    ) -> np.ndarray:
+        """
+        Merton prices for a whole strike vector.
+
+        Same series as ``price``; the Poisson weights, sigma_n and r_n depend
+        only on n, so they are computed once and the Black-Scholes terms are
+        evaluated as one (n_jumps, n_strikes) array.
+        """
+        strikes = np.asarray(strikes, dtype=np.float64)
+        T = time_to_expiry
+        if T <= 0:
+            payoff = spot - strikes if option_type == "call" else strikes - spot
+            return np.maximum(payoff, 0.0)
+
+        n, weights = _poisson_weights(lambda_j * (1 + mu_j) * T, max_jumps)
+        sigma_n = np.sqrt(sigma**2 + n * sigma_j**2 / T)[:, None]
+        r_n = (rate - lambda_j * mu_j + n * np.log1p(mu_j) / T)[:, None]
+
+        vol = sigma_n * np.sqrt(T)
+        d1 = (np.log(spot / strikes)[None, :] + (r_n + 0.5 * sigma_n**2) * T) / vol
+        d2 = d1 - vol
+        fwd_spot = spot * np.exp((r_n - rate) * T)
+        disc_strikes = strikes * np.exp(-rate * T)
+
+        if option_type == "call":
+            bs_prices = fwd_spot * ndtr(d1) - disc_strikes * ndtr(d2)
+        else:
+            bs_prices = disc_strikes * ndtr(-d2) - fwd_spot * ndtr(-d1)
+
+        return np.maximum((weights[:, None] * bs_prices).sum(axis=0), 0.0)
+
+
+# Jump counts whose Poisson log-weight falls below this (weight < ~1e-13) are dropped
+_LOG_WEIGHT_FLOOR = -30.0
+
+
+def _poisson_weights(lt: float, max_jumps: int):
+    """
+    Jump counts n < max_jumps with a non-negligible Poisson(lt) weight, and those weights.
+
+    Weights are exp(-lt + n log(lt) - lgamma(n + 1)). In log space they neither
+    underflow for large lt nor cut the series off at a tiny n = 0 term before
+    the Poisson mode is reached.
+    """
+    n = np.arange(max_jumps)
+    log_w = -lt + xlogy(n, lt) - gammaln(n + 1)
+    keep = log_w >= _LOG_WEIGHT_FLOOR
+    return n[keep], np.exp(log_w[keep])
+
 
 def implied_volatility_from_price(
     market_price: float,
@@ -225,31 +464,12 @@ def implied_volatility_from_price(
 
     For advanced models, uses Black-Scholes IV as approximation.
     """
-    from options_desk.pricing.black_scholes import black_scholes_price
-    from options_desk.core.option import OptionType
-
     if time_to_expiry <= 0 or market_price <= 0:
         return 0.0
 
-    opt_type = OptionType.CALL if option_type == "call" else OptionType.PUT
-
-    def objective(vol):
-        try:
-            if model == "black_scholes":
-                model_price = black_scholes_price(
-                    spot, strike, time_to_expiry, rate, vol, opt_type
-                )
-            else:
-                # For advanced models, use Black-Scholes as approximation
-                model_price = black_scholes_price(
-                    spot, strike, time_to_expiry, rate, vol, opt_type
-                )
-            return model_price - market_price
-        except:
-            return 1e10
-
-    try:
-        iv = brentq(objective, 0.001, 5.0, xtol=1e-6)
-        return max(0.001, min(5.0, iv))
-    except:
+    iv = float(black_scholes_implied_vol(
+        market_price, spot, strike, time_to_expiry, rate, 0.0, option_type == "call", tol=1e-12
+    ))
+    if not math.isfinite(iv):
         return 0.20  # Default fallback
+    return max(0.001, min(5.0, iv))
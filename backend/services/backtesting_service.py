@@ -10,11 +10,12 @@ Author: Generated for option_pricer_DLC
 import numpy as np
 from datetime import datetime, timedelta, date
 from typing import Dict, List, Any, Optional, Tuple
-from scipy.stats import norm
+from scipy.special import ndtr
 
 from options_desk.processes import GBM, Heston
 from options_desk.derivatives import EuropeanCall, EuropeanPut
 from options_desk.pricer import COSPricer, HestonAnalyticalPricer
+from options_desk.pricer._normal import INV_SQRT_2PI
 
 # Import Heston option chain generator (same as HestonEnv)
 from options_desk.calibration.data.synthetic_equity import (
@@ -209,10 +210,11 @@ class BacktestingService:
         std = np.sqrt(max(variance, 1e-12))
         d = (mean - K) / std
 
+        pdf_d = INV_SQRT_2PI * np.exp(-0.5 * d * d)
         if option_type == 'call':
-            price = (mean - K) * norm.cdf(d) + std * norm.pdf(d)
+            price = (mean - K) * ndtr(d) + std * pdf_d
         else:
-            price = (K - mean) * norm.cdf(-d) + std * norm.pdf(d)
+            price = (K - mean) * ndtr(-d) + std * pdf_d
 
         return float(np.exp(-r * tau) * price)
 
@@ -858,9 +860,9 @@ class BacktestingService:
         d2 = d1 - sigma * np.sqrt(tau)
 
         if option_type == 'call':
-            price = S * norm.cdf(d1) - K * np.exp(-r * tau) * norm.cdf(d2)
+            price = S * ndtr(d1) - K * np.exp(-r * tau) * ndtr(d2)
         else:
-            price = K * np.exp(-r * tau) * norm.cdf(-d2) - S * norm.cdf(-d1)
+            price = K * np.exp(-r * tau) * ndtr(-d2) - S * ndtr(-d1)
 
         return price
 
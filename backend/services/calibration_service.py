@@ -45,6 +45,9 @@ from options_desk.calibration.data import (
     MarketData,
 )
 
+from backend.services import yf_cache
+from backend.services.iv_vectorized import implied_vol_slice
+
 
 class CalibrationService:
     """Service for fetching data and calibrating P-measure and Q-measure models"""
@@ -612,8 +615,7 @@ class CalibrationService:
 
             # Try to fetch dividend yield from yfinance
             try:
-                stock = yf.Ticker(ticker)
-                info = stock.info
+                info = yf_cache.get_info(ticker)
                 div_yield_raw = info.get('dividendYield', 0.0) or 0.0
                 # yfinance returns dividend yield in percentage form (e.g., 1.07 for 1.07%)
                 # Convert to decimal if it's greater than 1
@@ -698,8 +700,7 @@ class CalibrationService:
 
             # Try to fetch dividend yield from yfinance
             try:
-                stock = yf.Ticker(ticker)
-                info = stock.info
+                info = yf_cache.get_info(ticker)
                 div_yield_raw = info.get('dividendYield', 0.0) or 0.0
                 # yfinance returns dividend yield in percentage form (e.g., 1.07 for 1.07%)
                 # Convert to decimal if it's greater than 1
@@ -997,20 +998,19 @@ class CalibrationService:
         iv_surface = np.zeros((len(maturities), len(strikes)))
 
         for i, T in enumerate(maturities):
+            call_prices = np.full(len(strikes), np.nan)
             for j, K in enumerate(strikes):
                 # Price call option
                 option = EuropeanCall(strike=K, maturity=T)
                 try:
                     result = pricer.price(option, heston, X0=np.array([S0, params['v0']]))
-                    call_price = max(result.price, 0.0)
+                    call_prices[j] = max(result.price, 0.0)
+                except Exception:
+                    pass
 
-                    # Back out implied volatility using Black-Scholes inversion
-                    iv = CalibrationService._implied_vol_from_price(
-                        call_price, S0, K, T, r, q, is_call=True
-                    )
-                    iv_surface[i, j] = iv
-                except:
-                    iv_surface[i, j] = 0.2  # Fallback
+            # Back out the whole row of implied volatilities in one Black-Scholes solve
+            ivs = implied_vol_slice(call_prices, S0, strikes, T, r, True, dividend_yield=q)
+            iv_surface[i] = np.where(np.isnan(ivs), 0.2, ivs)  # Fallback
 
         return {
             'strikes': strikes.tolist(),
@@ -1058,52 +1058,6 @@ class CalibrationService:
             'surface_type': 'implied_vol',
         }
 
-    @staticmethod
-    def _implied_vol_from_price(
-        price: float,
-        S: float,
-        K: float,
-        T: float,
-        r: float,
-        q: float,
-        is_call: bool = True,
-    ) -> float:
-        """
-        Calculate implied volatility from option price using Newton-Raphson.
-
-        Simple Black-Scholes IV inversion.
-        """
-        from scipy.stats import norm
-
-        # Initial guess
-        sigma = 0.2
-
-        # Newton-Raphson iterations
-        for _ in range(50):
-            d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-            d2 = d1 - sigma * np.sqrt(T)
-
-            if is_call:
-                bs_price = S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-                vega = S * np.exp(-q * T) * norm.pdf(d1) * np.sqrt(T)
-            else:
-                bs_price = K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(-q * T) * norm.cdf(-d1)
-                vega = S * np.exp(-q * T) * norm.pdf(d1) * np.sqrt(T)
-
-            if vega < 1e-10:
-                break
-
-            diff = price - bs_price
-            if abs(diff) < 1e-6:
-                break
-
-            sigma = sigma + diff / vega
-
-            # Bounds
-            sigma = max(0.01, min(sigma, 3.0))
-
-        return sigma
-
 
 # Singleton instance
 calibration_service = CalibrationService()
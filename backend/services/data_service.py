@@ -1,21 +1,93 @@
 """Data fetching service using yfinance."""
+import threading
+import numpy as np
+import pandas as pd
 import yfinance as yf
-from typing import List, Optional
-from datetime import datetime
+from cachetools import TTLCache
+from typing import Callable, Hashable, List, Optional
+from backend.core.config import settings
+from backend.core.dates import parse_iso_date, days_to_expiry
 from backend.schemas.data import (
     OptionChainRequest,
     OptionChainResponse,
     OptionContractData,
     AvailableExpirationsResponse,
 )
+from backend.services import yf_cache
+from backend.services.iv_vectorized import implied_vol_bs_slice
+
+
+# Computed option-chain responses (with the IV solve) are reused for a minute.
+# This is the only cache layer for chains: _fetch_option_chain goes to yfinance
+# directly, so a response is never older than this TTL.
+CHAIN_CACHE_TTL_SECONDS = 60
+
+
+def _float_column(frame: pd.DataFrame, name: str) -> list:
+    """Column as a list of Python floats, NaN where missing or unparseable."""
+    if name not in frame:
+        return [float("nan")] * len(frame)
+    return pd.to_numeric(frame[name], errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
+    ).tolist()
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    """NaN (the only value unequal to itself) becomes None."""
+    return None if value != value else value
+
+
+def _nan_to_int(value: float) -> Optional[int]:
+    """Integer count, None where NaN."""
+    return None if value != value else int(value)
 
 
 class DataService:
     """Service for fetching market data."""
 
+    def __init__(self):
+        self._chain_cache = TTLCache(maxsize=256, ttl=CHAIN_CACHE_TTL_SECONDS)
+        # Handlers run in worker threads and TTLCache is not thread-safe
+        self._cache_lock = threading.Lock()
+
+    def get_option_chain(self, request: OptionChainRequest) -> OptionChainResponse:
+        """Fetch option chain data, reusing a response computed within CHAIN_CACHE_TTL_SECONDS."""
+        key = (request.symbol.upper(), request.expiration_date or "nearest")
+        return self._cached(
+            self._chain_cache, key, lambda: DataService._fetch_option_chain(request)
+        )
+
+    def get_available_expirations(self, symbol: str) -> AvailableExpirationsResponse:
+        """
+        Get list of available expiration dates for a symbol.
+
+        Not cached here: the /expirations endpoint's response cache
+        (settings.CACHE_TTL_SECONDS) is the single cache layer for this list.
+        """
+        return DataService._fetch_available_expirations(symbol)
+
+    def _cached(self, cache: TTLCache, key: Hashable, fetch: Callable):
+        """Return the cached value for key, calling fetch and storing its result on a miss."""
+        if not settings.ENABLE_CACHE:
+            return fetch()
+
+        with self._cache_lock:
+            value = cache.get(key)
+        if value is None:
+            value = fetch()
+            with self._cache_lock:
+                cache[key] = value
+        return value
+
     @staticmethod
-    def get_option_chain(request: OptionChainRequest) -> OptionChainResponse:
-        """Fetch option chain data from yfinance."""
+    def _fetch_option_chain(request: OptionChainRequest) -> OptionChainResponse:
+        """
+        Fetch option chain data from yfinance.
+
+        Bypasses the yf_cache chain caches so the response cache in
+        get_option_chain alone decides how old a chain can be. One Ticker serves
+        both requests: option_chain() reuses the expiration map it downloaded.
+        """
         ticker = yf.Ticker(request.symbol)
 
         # Get available expiration dates
@@ -37,60 +109,19 @@ class DataService:
         # Fetch option chain
         chain = ticker.option_chain(expiration)
 
-        # Get current spot price
-        info = ticker.info
-        spot_price = info.get("currentPrice") or info.get("regularMarketPrice", 0.0)
-
-        # Parse calls and puts
-        contracts = []
-
-        def safe_float(value):
-            """Convert to float, handling NaN."""
-            import pandas as pd
-            if pd.isna(value):
-                return None
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-
-        def safe_int(value):
-            """Convert to int, handling NaN."""
-            import pandas as pd
-            if pd.isna(value):
-                return None
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return None
-
-        for _, row in chain.calls.iterrows():
-            contracts.append(
-                OptionContractData(
-                    strike=float(row["strike"]),
-                    last_price=safe_float(row.get("lastPrice")),
-                    bid=safe_float(row.get("bid")),
-                    ask=safe_float(row.get("ask")),
-                    volume=safe_int(row.get("volume")),
-                    open_interest=safe_int(row.get("openInterest")),
-                    implied_volatility=safe_float(row.get("impliedVolatility")),
-                    option_type="call",
-                )
-            )
+        # Get current spot price from the chain's underlying quote
+        spot_price = yf_cache.spot_price(request.symbol, chain)
 
-        for _, row in chain.puts.iterrows():
-            contracts.append(
-                OptionContractData(
-                    strike=float(row["strike"]),
-                    last_price=safe_float(row.get("lastPrice")),
-                    bid=safe_float(row.get("bid")),
-                    ask=safe_float(row.get("ask")),
-                    volume=safe_int(row.get("volume")),
-                    open_interest=safe_int(row.get("openInterest")),
-                    implied_volatility=safe_float(row.get("impliedVolatility")),
-                    option_type="put",
-                )
-            )
+        # Invert the whole chain (calls stacked on puts) in one vectorized solve
+        implied_vols = DataService._chain_implied_vols(
+            chain.calls, chain.puts, spot_price, expiration
+        )
+
+        # Build contracts column-wise; every field is already coerced to
+        # float/int/None here, so the contracts skip pydantic validation
+        n_calls = len(chain.calls)
+        contracts = DataService._contracts(chain.calls, implied_vols[:n_calls], "call")
+        contracts += DataService._contracts(chain.puts, implied_vols[n_calls:], "put")
 
         return OptionChainResponse(
             symbol=request.symbol,
@@ -100,10 +131,77 @@ class DataService:
         )
 
     @staticmethod
-    def get_available_expirations(symbol: str) -> AvailableExpirationsResponse:
+    def _contracts(
+        frame: pd.DataFrame, implied_vols: np.ndarray, option_type: str
+    ) -> List[OptionContractData]:
+        """Contracts for one side of the chain, read from column arrays."""
+        strikes = frame["strike"].to_numpy(dtype=np.float64).tolist()
+        last_prices = _float_column(frame, "lastPrice")
+        bids = _float_column(frame, "bid")
+        asks = _float_column(frame, "ask")
+        volumes = _float_column(frame, "volume")
+        open_interests = _float_column(frame, "openInterest")
+        ivs = implied_vols.tolist()
+
+        return [
+            OptionContractData.model_construct(
+                strike=strikes[i],
+                last_price=_nan_to_none(last_prices[i]),
+                bid=_nan_to_none(bids[i]),
+                ask=_nan_to_none(asks[i]),
+                volume=_nan_to_int(volumes[i]),
+                open_interest=_nan_to_int(open_interests[i]),
+                implied_volatility=_nan_to_none(ivs[i]),
+                option_type=option_type,
+            )
+            for i in range(len(strikes))
+        ]
+
+    @staticmethod
+    def _market_prices(frame: pd.DataFrame) -> np.ndarray:
+        """Mid price where both sides are quoted, otherwise the last traded price."""
+        bid = frame["bid"].to_numpy(dtype=np.float64, na_value=np.nan)
+        ask = frame["ask"].to_numpy(dtype=np.float64, na_value=np.nan)
+        last = frame["lastPrice"].to_numpy(dtype=np.float64, na_value=np.nan)
+        quoted = (bid > 0) & (ask >= bid)
+        return np.where(quoted, 0.5 * (bid + ask), last)
+
+    @staticmethod
+    def _chain_implied_vols(
+        calls: pd.DataFrame, puts: pd.DataFrame, spot_price: float, expiration: str
+    ) -> np.ndarray:
+        """
+        Implied vols for calls followed by puts.
+
+        NaN (None in the response) where a quote cannot be inverted (stale,
+        arbitrage-violating) or the spot price is unknown.
+        """
+        if not spot_price:
+            return np.full(len(calls) + len(puts), np.nan)
+
+        days = days_to_expiry(parse_iso_date(expiration))
+        tau = max(days / 365.25, 1 / 365.25)  # At least 1 day
+        df = np.exp(-settings.DEFAULT_RISK_FREE_RATE * tau)
+
+        strikes = np.concatenate([
+            calls["strike"].to_numpy(dtype=np.float64),
+            puts["strike"].to_numpy(dtype=np.float64),
+        ])
+        prices = np.concatenate([
+            DataService._market_prices(calls),
+            DataService._market_prices(puts),
+        ])
+        is_call = np.concatenate([
+            np.ones(len(calls), dtype=bool),
+            np.zeros(len(puts), dtype=bool),
+        ])
+
+        return implied_vol_bs_slice(spot_price / df, strikes, tau, df, prices, is_call)
+
+    @staticmethod
+    def _fetch_available_expirations(symbol: str) -> AvailableExpirationsResponse:
         """Get list of available expiration dates for a symbol."""
-        ticker = yf.Ticker(symbol)
-        expirations = ticker.options
+        expirations = yf.Ticker(symbol).options
 
         if not expirations:
             raise ValueError(f"No options available for {symbol}")
@@ -0,0 +1,88 @@
+"""Black-Scholes implied volatilities for a single expiry slice."""
+import numpy as np
+
+from options_desk.pricer import black_scholes_implied_vol
+
+
+def implied_vol_bs_slice(
+    forward: float,
+    strikes: np.ndarray,
+    tau: float,
+    df: float,
+    prices: np.ndarray,
+    is_call: np.ndarray,
+    tol: float = 1e-8,
+    max_iter: int = 32,
+) -> np.ndarray:
+    """
+    Invert Black-Scholes prices to implied volatilities for a whole strike vector.
+
+    In-the-money quotes are first folded to their out-of-the-money counterpart via
+    put-call parity, where the time value is not lost under the intrinsic value.
+    The valid quotes are then inverted in one call to the library solver
+    (options_desk.pricer.black_scholes_implied_vol) with the forward as spot and
+    the carry set so that S exp(-qT) = df * F and K exp(-rT) = df * K.
+
+    Args:
+        forward: Forward price of the underlying for this expiry
+        strikes: Strike prices
+        tau: Time to expiry in years
+        df: Discount factor exp(-r * tau)
+        prices: Market option prices, aligned with ``strikes``
+        is_call: Boolean call flags (scalar or aligned with ``strikes``)
+        tol: Volatility tolerance on the Newton step
+        max_iter: Maximum number of Newton iterations
+
+    Returns:
+        Implied volatilities; NaN where the quote violates no-arbitrage bounds
+        or the solver did not converge.
+    """
+    strikes = np.asarray(strikes, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), strikes.shape)
+
+    ivs = np.full(strikes.shape, np.nan)
+    if tau <= 0 or forward <= 0 or strikes.size == 0:
+        return ivs
+
+    # Fold every quote onto the out-of-the-money side: calls above the forward,
+    # puts below. Parity shifts the price by the discounted forward intrinsic.
+    otm_call = strikes >= forward
+    parity = df * (forward - strikes)
+    otm_prices = np.where(
+        is_call == otm_call, prices, np.where(is_call, prices - parity, prices + parity)
+    )
+
+    # OTM quotes must sit strictly between zero and the trivial upper bound
+    upper = df * np.where(otm_call, forward, strikes)
+    with np.errstate(invalid="ignore"):
+        valid = (strikes > 0) & np.isfinite(otm_prices) & (otm_prices > 0) & (otm_prices < upper)
+    if not valid.any():
+        return ivs
+
+    rate = -np.log(df) / tau
+    ivs[valid] = black_scholes_implied_vol(
+        otm_prices[valid], forward, strikes[valid], tau, rate, rate, otm_call[valid],
+        tol=tol, max_iter=max_iter,
+    )
+    return ivs
+
+
+def implied_vol_slice(
+    prices: np.ndarray,
+    spot: float,
+    strikes: np.ndarray,
+    tau: float,
+    rate: float,
+    is_call: np.ndarray,
+    dividend_yield: float = 0.0,
+) -> np.ndarray:
+    """
+    implied_vol_bs_slice for spot-quoted inputs.
+
+    Builds the forward S * exp((r - q) * tau) and discount factor exp(-r * tau)
+    for the expiry and inverts every strike in one solve.
+    """
+    df = np.exp(-rate * tau)
+    forward = spot * np.exp((rate - dividend_yield) * tau)
+    return implied_vol_bs_slice(forward, strikes, tau, df, prices, is_call)
@@ -1,5 +1,7 @@
 """Market data service using yfinance."""
-import yfinance as yf
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from datetime import datetime, timedelta
 from backend.schemas.market import (
@@ -11,6 +13,7 @@ from backend.schemas.market import (
     OHLCDataPoint,
     OHLCChartResponse,
 )
+from backend.services import yf_cache
 
 
 class MarketService:
@@ -43,35 +46,20 @@ class MarketService:
     def _get_quote_data(symbol: str, name: str) -> QuoteData:
         """Fetch quote data for a single symbol."""
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            hist = ticker.history(period="2d")
-
-            if hist.empty or len(hist) < 1:
-                # Try to get current price from info
-                last_price = info.get("currentPrice") or info.get("regularMarketPrice")
-                return QuoteData(
-                    symbol=symbol,
-                    name=name,
-                    last_price=last_price,
-                    change=None,
-                    change_percent=None,
-                    volume=info.get("volume"),
-                )
-
-            last_close = hist["Close"].iloc[-1]
-            prev_close = hist["Close"].iloc[-2] if len(hist) >= 2 else last_close
-
-            change = last_close - prev_close
-            change_percent = (change / prev_close * 100) if prev_close != 0 else 0
+            hist = yf_cache.get_history(symbol, "2d")
+            if not hist.empty:
+                return MarketService._quote_from_history(symbol, name, hist)
 
+            # Try to get current price from info
+            info = yf_cache.get_info(symbol)
+            last_price = info.get("currentPrice") or info.get("regularMarketPrice")
             return QuoteData(
                 symbol=symbol,
                 name=name,
-                last_price=float(last_close),
-                change=float(change),
-                change_percent=float(change_percent),
-                volume=int(hist["Volume"].iloc[-1]) if "Volume" in hist.columns else None,
+                last_price=last_price,
+                change=None,
+                change_percent=None,
+                volume=info.get("volume"),
             )
         except Exception as e:
             print(f"Error fetching {symbol}: {e}")
@@ -84,23 +72,59 @@ class MarketService:
                 volume=None,
             )
 
+    @staticmethod
+    def _quote_from_history(symbol: str, name: str, hist) -> QuoteData:
+        """Build a quote from the last two daily closes of a non-empty history frame."""
+        last_close = hist["Close"].iloc[-1]
+        prev_close = hist["Close"].iloc[-2] if len(hist) >= 2 else last_close
+
+        change = last_close - prev_close
+        change_percent = (change / prev_close * 100) if prev_close != 0 else 0
+
+        volume = hist["Volume"].iloc[-1] if "Volume" in hist.columns else None
+        return QuoteData(
+            symbol=symbol,
+            name=name,
+            last_price=float(last_close),
+            change=float(change),
+            change_percent=float(change_percent),
+            volume=int(volume) if volume is not None and pd.notna(volume) else None,
+        )
+
     @staticmethod
     def get_market_overview() -> MarketOverviewResponse:
         """Fetch market overview data."""
-        indices = [
-            MarketService._get_quote_data(symbol, name)
-            for symbol, name in MarketService.INDICES
-        ]
-
-        magnificent7 = [
-            MarketService._get_quote_data(symbol, name)
-            for symbol, name in MarketService.MAGNIFICENT7
-        ]
+        groups = (MarketService.INDICES, MarketService.MAGNIFICENT7, MarketService.COMMODITIES)
+        symbols = [entry for group in groups for entry in group]
 
-        commodities = [
-            MarketService._get_quote_data(symbol, name)
-            for symbol, name in MarketService.COMMODITIES
-        ]
+        # One multi-ticker download covers every symbol
+        try:
+            history = yf_cache.download_history(tuple(symbol for symbol, _ in symbols), "2d")
+        except Exception as e:
+            print(f"Error downloading market overview: {e}")
+            history = None
+
+        quotes = []
+        missing = []
+        for i, (symbol, name) in enumerate(symbols):
+            hist = MarketService._history_slice(history, symbol)
+            if hist is None:
+                quotes.append(None)
+                missing.append(i)
+            else:
+                quotes.append(MarketService._quote_from_history(symbol, name, hist))
+
+        # Symbols absent from the batch fall back to per-ticker requests, concurrently
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+                fallback = pool.map(lambda i: MarketService._get_quote_data(*symbols[i]), missing)
+                for i, quote in zip(missing, fallback):
+                    quotes[i] = quote
+
+        n_indices, n_mag7 = len(MarketService.INDICES), len(MarketService.MAGNIFICENT7)
+        indices = quotes[:n_indices]
+        magnificent7 = quotes[n_indices:n_indices + n_mag7]
+        commodities = quotes[n_indices + n_mag7:]
 
         return MarketOverviewResponse(
             indices=indices,
@@ -108,6 +132,19 @@ class MarketService:
             commodities=commodities,
         )
 
+    @staticmethod
+    def _history_slice(history, symbol: str):
+        """
+        One symbol's rows from a multi-ticker download, or None if it has no data.
+
+        The batch frame spans the union of all trading days, so rows where this
+        symbol did not trade are dropped.
+        """
+        if history is None or symbol not in history.columns.get_level_values(0):
+            return None
+        hist = history[symbol].dropna(subset=["Close"])
+        return None if hist.empty else hist
+
     @staticmethod
     def get_index_charts() -> IndexChartsResponse:
         """Fetch 1-year historical data for major indices."""
@@ -119,19 +156,30 @@ class MarketService:
             ("^IXIC", "NASDAQ"),
         ]
 
+        # Both indices come back from one multi-ticker request
+        try:
+            history = yf_cache.download_history(
+                tuple(symbol for symbol, _ in chart_symbols), "1y"
+            )
+        except Exception as e:
+            print(f"Error downloading index charts: {e}")
+            history = None
+
         for symbol, name in chart_symbols:
             try:
-                ticker = yf.Ticker(symbol)
                 # Get 1 year of data
-                hist = ticker.history(period="1y")
+                hist = MarketService._history_slice(history, symbol)
+                if hist is None:
+                    hist = yf_cache.get_history(symbol, "1y")
 
                 if not hist.empty:
+                    # Column arrays in, unvalidated points out: yfinance already
+                    # gives typed floats
+                    dates = hist.index.strftime("%Y-%m-%d").tolist()
+                    closes = hist["Close"].to_numpy(dtype=np.float64).tolist()
                     data_points = [
-                        HistoricalDataPoint(
-                            date=date.strftime("%Y-%m-%d"),
-                            close=float(row["Close"]),
-                        )
-                        for date, row in hist.iterrows()
+                        HistoricalDataPoint.model_construct(date=date, close=close)
+                        for date, close in zip(dates, closes)
                     ]
 
                     charts.append(
@@ -151,22 +199,24 @@ class MarketService:
     def get_ohlc_data(symbol: str, period: str = "6mo") -> OHLCChartResponse:
         """Fetch OHLC (candlestick) data for a symbol."""
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
+            hist = yf_cache.get_history(symbol, period)
 
             if hist.empty:
                 raise ValueError(f"No historical data available for {symbol}")
 
+            columns = zip(
+                hist.index.strftime("%Y-%m-%d").tolist(),
+                hist["Open"].to_numpy(dtype=np.float64).tolist(),
+                hist["High"].to_numpy(dtype=np.float64).tolist(),
+                hist["Low"].to_numpy(dtype=np.float64).tolist(),
+                hist["Close"].to_numpy(dtype=np.float64).tolist(),
+                hist["Volume"].to_numpy(dtype=np.int64).tolist(),
+            )
             data_points = [
-                OHLCDataPoint(
-                    date=date.strftime("%Y-%m-%d"),
-                    open=float(row["Open"]),
-                    high=float(row["High"]),
-                    low=float(row["Low"]),
-                    close=float(row["Close"]),
-                    volume=int(row["Volume"]),
+                OHLCDataPoint.model_construct(
+                    date=date, open=open_, high=high, low=low, close=close, volume=volume
                 )
-                for date, row in hist.iterrows()
+                for date, open_, high, low, close, volume in columns
             ]
 
             return OHLCChartResponse(symbol=symbol, data=data_points)
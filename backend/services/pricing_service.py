@@ -1,12 +1,4 @@
 """Pricing and Greeks calculation service."""
-import numpy as np
-from scipy.stats import norm
-
-# Use new pricer module
-from options_desk.pricer import BlackScholesPricer
-from options_desk.derivatives import EuropeanCall, EuropeanPut
-from options_desk.processes import GBM
-
 from backend.schemas.pricing import (
     PricingRequest,
     PricingResponse,
@@ -14,6 +6,18 @@ from backend.schemas.pricing import (
     GreeksResponse,
 )
 from backend.schemas.common import OptionType
+from backend.services.bs_kernels import bs_price, bs_greeks, specialize
+
+# Most requests leave rate and dividend yield at the schema defaults; serve those
+# from kernels with both constants folded in
+_DEFAULT_RATE = PricingRequest.model_fields["risk_free_rate"].default
+_DEFAULT_DIVIDEND = PricingRequest.model_fields["dividend_yield"].default
+_default_price, _default_greeks = specialize(_DEFAULT_RATE, _DEFAULT_DIVIDEND)
+
+
+def _uses_defaults(request) -> bool:
+    """Whether the request can be served by the specialized default kernels."""
+    return request.risk_free_rate == _DEFAULT_RATE and request.dividend_yield == _DEFAULT_DIVIDEND
 
 
 class PricingService:
@@ -22,76 +26,47 @@ class PricingService:
     @staticmethod
     def calculate_price(request: PricingRequest) -> PricingResponse:
         """Calculate option price using Black-Scholes model."""
-        # Create derivative based on option type
-        if request.option_type == OptionType.CALL:
-            option = EuropeanCall(
-                strike=request.strike,
-                maturity=request.time_to_expiry,
+        is_call = request.option_type == OptionType.CALL
+        if _uses_defaults(request):
+            price = _default_price(
+                request.spot, request.strike, request.time_to_expiry, request.volatility, is_call
             )
         else:
-            option = EuropeanPut(
-                strike=request.strike,
-                maturity=request.time_to_expiry,
+            price = bs_price(
+                request.spot,
+                request.strike,
+                request.time_to_expiry,
+                request.risk_free_rate,
+                request.dividend_yield,
+                request.volatility,
+                is_call,
             )
 
-        # Create GBM process (mu doesn't affect BS price, only sigma matters)
-        process = GBM(mu=request.risk_free_rate, sigma=request.volatility)
-
-        # Create pricer
-        pricer = BlackScholesPricer(
-            risk_free_rate=request.risk_free_rate,
-            dividend_yield=request.dividend_yield,
-        )
-
-        # Price the option
-        result = pricer.price(
-            derivative=option,
-            process=process,
-            X0=request.spot,
-            compute_greeks=False,
-        )
-
-        return PricingResponse(price=float(result.price), model="black_scholes")
+        return PricingResponse(price=float(price), model="black_scholes")
 
     @staticmethod
     def calculate_greeks(request: GreeksRequest) -> GreeksResponse:
         """Calculate all Greeks for an option."""
-        # Create derivative based on option type
-        if request.option_type == OptionType.CALL:
-            option = EuropeanCall(
-                strike=request.strike,
-                maturity=request.time_to_expiry,
+        is_call = request.option_type == OptionType.CALL
+        if _uses_defaults(request):
+            delta, gamma, vega, theta, rho = _default_greeks(
+                request.spot, request.strike, request.time_to_expiry, request.volatility, is_call
             )
         else:
-            option = EuropeanPut(
-                strike=request.strike,
-                maturity=request.time_to_expiry,
+            delta, gamma, vega, theta, rho = bs_greeks(
+                request.spot,
+                request.strike,
+                request.time_to_expiry,
+                request.risk_free_rate,
+                request.dividend_yield,
+                request.volatility,
+                is_call,
             )
 
-        # Create GBM process
-        process = GBM(mu=request.risk_free_rate, sigma=request.volatility)
-
-        # Create pricer
-        pricer = BlackScholesPricer(
-            risk_free_rate=request.risk_free_rate,
-            dividend_yield=request.dividend_yield,
-        )
-
-        # Price with Greeks
-        result = pricer.price(
-            derivative=option,
-            process=process,
-            X0=request.spot,
-            compute_greeks=True,
-        )
-
-        # Extract Greeks from result
-        greeks = result.greeks or {}
-
         return GreeksResponse(
-            delta=float(greeks.get('delta', 0.0)),
-            gamma=float(greeks.get('gamma', 0.0)),
-            vega=float(greeks.get('vega', 0.0)),
-            theta=float(greeks.get('theta', 0.0)),
-            rho=float(greeks.get('rho', 0.0)),
+            delta=float(delta),
+            gamma=float(gamma),
+            vega=float(vega),
+            theta=float(theta),
+            rho=float(rho),
         )
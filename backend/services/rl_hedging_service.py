@@ -13,7 +13,7 @@ Author: Generated for option_pricer_DLC
 
 import numpy as np
 from typing import Dict, List, Any, Optional
-from scipy.stats import norm
+from scipy.special import ndtr
 
 
 class RLHedgingService:
@@ -164,7 +164,7 @@ class RLHedgingService:
                     np.log(S / strike)
                     + (risk_free_rate + 0.5 * volatility ** 2) * tau
                 ) / (volatility * np.sqrt(tau))
-                bs_delta = norm.cdf(d1)
+                bs_delta = ndtr(d1)
             else:
                 bs_delta = 1.0 if S > strike else 0.0
 
@@ -1,15 +1,16 @@
 """Volatility smile comparison service."""
-import yfinance as yf
 import numpy as np
-from datetime import datetime
+import pandas as pd
 from typing import List
+from backend.core.dates import days_to_expiry
 from backend.schemas.smile import VolSmileRequest, VolSmileComparisonResponse, VolSmileDataPoint
 from backend.services.advanced_pricing import (
     HestonModel,
     SABRModel,
     MertonJumpDiffusion,
-    implied_volatility_from_price,
 )
+from backend.services import yf_cache
+from backend.services.iv_vectorized import implied_vol_bs_slice
 
 
 class SmileService:
@@ -18,125 +19,72 @@ class SmileService:
     @staticmethod
     def get_volatility_smile_comparison(request: VolSmileRequest) -> VolSmileComparisonResponse:
         """Get volatility smile with market IV vs calculated IV from different models."""
-        ticker = yf.Ticker(request.symbol)
-
-        # Get spot price
-        info = ticker.info
-        spot_price = info.get("currentPrice") or info.get("regularMarketPrice", 0.0)
-
-        if spot_price == 0:
-            raise ValueError(f"Could not fetch spot price for {request.symbol}")
-
         # Verify expiration exists
-        if request.expiration_date not in ticker.options:
+        if not yf_cache.has_expiration(request.symbol, request.expiration_date):
             raise ValueError(
                 f"Expiration {request.expiration_date} not available for {request.symbol}"
             )
 
         # Calculate time to expiry
-        exp_date = datetime.strptime(request.expiration_date, "%Y-%m-%d")
-        days_to_expiry = (exp_date - datetime.now()).days
-        time_to_expiry = max(days_to_expiry / 365.25, 1/365.25)  # At least 1 day
+        days = days_to_expiry(request.expiration)
+        time_to_expiry = max(days / 365.25, 1/365.25)  # At least 1 day
 
         # Get option chain
-        chain = ticker.option_chain(request.expiration_date)
+        chain = yf_cache.get_option_chain(request.symbol, request.expiration_date)
+
+        # Get spot price from the chain's underlying quote
+        spot_price = yf_cache.spot_price(request.symbol, chain)
+
+        if spot_price == 0:
+            raise ValueError(f"Could not fetch spot price for {request.symbol}")
 
         # Use treasury rate as risk-free rate (simplified)
         risk_free_rate = 0.05  # 5% default
 
-        data_points: List[VolSmileDataPoint] = []
-
-        # Process calls
-        for _, row in chain.calls.iterrows():
-            strike = float(row["strike"])
-            market_iv = SmileService._safe_float(row.get("impliedVolatility"))
-            last_price = SmileService._safe_float(row.get("lastPrice"))
-
-            if market_iv is None or market_iv <= 0 or last_price is None:
-                continue
-
-            moneyness = strike / spot_price
-            calculated_ivs = {}
-
-            # Calculate IV for each requested model
-            for model in request.models:
-                try:
-                    if model == "black_scholes":
-                        # For BS, market IV is the calculated IV
-                        calculated_ivs[model] = market_iv
-
-                    elif model == "heston":
-                        # Calculate Heston price and back out IV
-                        heston_price = HestonModel.price(
-                            spot=spot_price,
-                            strike=strike,
-                            time_to_expiry=time_to_expiry,
-                            rate=risk_free_rate,
-                            v0=request.heston_v0,
-                            theta=request.heston_theta,
-                            kappa=request.heston_kappa,
-                            sigma_v=request.heston_sigma_v,
-                            rho=request.heston_rho,
-                            option_type="call",
-                        )
-                        # Back out IV using BS formula
-                        calculated_iv = implied_volatility_from_price(
-                            heston_price, spot_price, strike, time_to_expiry,
-                            risk_free_rate, "call"
-                        )
-                        calculated_ivs[model] = calculated_iv
-
-                    elif model == "sabr":
-                        # SABR directly gives IV
-                        sabr_iv = SABRModel.implied_volatility(
-                            forward=spot_price * np.exp(risk_free_rate * time_to_expiry),
-                            strike=strike,
-                            time_to_expiry=time_to_expiry,
-                            alpha=request.sabr_alpha,
-                            beta=request.sabr_beta,
-                            rho=request.sabr_rho,
-                            nu=request.sabr_nu,
-                        )
-                        calculated_ivs[model] = sabr_iv
-
-                    elif model == "merton":
-                        # Calculate Merton price and back out IV
-                        merton_price = MertonJumpDiffusion.price(
-                            spot=spot_price,
-                            strike=strike,
-                            time_to_expiry=time_to_expiry,
-                            rate=risk_free_rate,
-                            sigma=np.sqrt(request.heston_v0),  # Use base volatility
-                            lambda_j=request.merton_lambda,
-                            mu_j=request.merton_mu_j,
-                            sigma_j=request.merton_sigma_j,
-                            option_type="call",
-                        )
-                        calculated_iv = implied_volatility_from_price(
-                            merton_price, spot_price, strike, time_to_expiry,
-                            risk_free_rate, "call"
-                        )
-                        calculated_ivs[model] = calculated_iv
-
-                except Exception as e:
-                    print(f"Error calculating {model} IV for strike {strike}: {e}")
-                    calculated_ivs[model] = market_iv  # Fallback to market IV
-
-            data_points.append(
-                VolSmileDataPoint(
-                    strike=strike,
-                    moneyness=moneyness,
-                    market_iv=market_iv,
-                    calculated_ivs=calculated_ivs,
+        forward = spot_price * np.exp(risk_free_rate * time_to_expiry)
+        discount = np.exp(-risk_free_rate * time_to_expiry)
+
+        # Column arrays for the usable call quotes, sorted by strike
+        calls = chain.calls
+        strikes = calls["strike"].to_numpy(dtype=np.float64)
+        market_ivs = SmileService._column(calls, "impliedVolatility")
+        last_prices = SmileService._column(calls, "lastPrice")
+
+        keep = (market_ivs > 0) & ~np.isnan(last_prices)
+        order = np.argsort(strikes[keep], kind="stable")
+        strikes = strikes[keep][order]
+        market_ivs = market_ivs[keep][order]
+        moneyness = strikes / spot_price
+
+        # One vectorized pass per model over the whole strike vector
+        model_ivs = {}
+        for model in request.models:
+            try:
+                ivs = SmileService._model_ivs(
+                    model, request, spot_price, forward, strikes, time_to_expiry,
+                    risk_free_rate, discount, market_ivs,
                 )
+            except Exception as e:
+                print(f"Error calculating {model} IVs: {e}")
+                ivs = np.full(strikes.shape, np.nan)
+            # Strikes the model could not price fall back to market IV
+            model_ivs[model] = np.where(np.isfinite(ivs), ivs, market_ivs).tolist()
+
+        data_points: List[VolSmileDataPoint] = [
+            VolSmileDataPoint(
+                strike=strike,
+                moneyness=m,
+                market_iv=market_iv,
+                calculated_ivs={model: ivs[i] for model, ivs in model_ivs.items()},
             )
+            for i, (strike, m, market_iv) in enumerate(
+                zip(strikes.tolist(), moneyness.tolist(), market_ivs.tolist())
+            )
+        ]
 
         # Process puts (optional - can add if needed)
         # Similar logic for puts...
 
-        # Sort by strike
-        data_points.sort(key=lambda x: x.strike)
-
         return VolSmileComparisonResponse(
             symbol=request.symbol,
             expiration_date=request.expiration_date,
@@ -148,12 +96,69 @@ class SmileService:
         )
 
     @staticmethod
-    def _safe_float(value):
-        """Convert to float, handling NaN."""
-        import pandas as pd
-        if pd.isna(value):
-            return None
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return None
+    def _model_ivs(
+        model: str,
+        request: VolSmileRequest,
+        spot: float,
+        forward: float,
+        strikes: np.ndarray,
+        T: float,
+        rate: float,
+        discount: float,
+        market_ivs: np.ndarray,
+    ) -> np.ndarray:
+        """Implied volatilities of one model across all strikes (NaN where it fails)."""
+        if model == "black_scholes":
+            # For BS, market IV is the calculated IV
+            return market_ivs.copy()
+
+        if model == "sabr":
+            # SABR directly gives IV, in closed form for the whole strike vector
+            return SABRModel.implied_volatility_vec(
+                forward=forward,
+                strikes=strikes,
+                time_to_expiry=T,
+                alpha=request.sabr_alpha,
+                beta=request.sabr_beta,
+                rho=request.sabr_rho,
+                nu=request.sabr_nu,
+            )
+
+        if model == "heston":
+            # One Carr-Madan FFT prices the whole slice
+            prices = HestonModel.price_fft(
+                spot=spot,
+                strikes=strikes,
+                time_to_expiry=T,
+                rate=rate,
+                v0=request.heston_v0,
+                theta=request.heston_theta,
+                kappa=request.heston_kappa,
+                sigma_v=request.heston_sigma_v,
+                rho=request.heston_rho,
+            )
+        elif model == "merton":
+            # Poisson weights are shared, so the jump series runs over the strike vector
+            prices = MertonJumpDiffusion.price_vec(
+                spot=spot,
+                strikes=strikes,
+                time_to_expiry=T,
+                rate=rate,
+                sigma=np.sqrt(request.heston_v0),  # Use base volatility
+                lambda_j=request.merton_lambda,
+                mu_j=request.merton_mu_j,
+                sigma_j=request.merton_sigma_j,
+                option_type="call",
+            )
+        else:
+            return np.full(strikes.shape, np.nan)
+
+        # Back out Black-Scholes IVs from the model prices in one slice solve
+        return implied_vol_bs_slice(forward, strikes, T, discount, prices, True)
+
+    @staticmethod
+    def _column(frame, name: str) -> np.ndarray:
+        """Numeric column as float64, NaN where missing or unparseable."""
+        if name not in frame:
+            return np.full(len(frame), np.nan)
+        return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=np.float64)
@@ -1,27 +1,31 @@
 """Volatility surface building service."""
-import yfinance as yf
 import pandas as pd
 import numpy as np
-from typing import List
-from datetime import datetime
-from scipy.interpolate import griddata, Rbf
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from scipy.interpolate import RegularGridInterpolator
+from backend.core.dates import days_to_expiry, days_to_expiries
 from backend.schemas.surface import (
     VolSurfaceRequest,
     VolSurfaceResponse,
-    VolSurfacePoint,
     VolSmileRequest,
     VolSmileResponse,
 )
+from backend.services import yf_cache
 
+# Concurrent option chain requests per surface build (keeps yfinance rate limits happy)
+MAX_CHAIN_WORKERS = 8
 
-def safe_float(value):
-    """Convert to float, handling NaN."""
-    if pd.isna(value):
-        return None
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
+# Below this many quotes the surface is returned uninterpolated
+MIN_INTERPOLATION_POINTS = 16
+
+# In-memory surface representation: one record per point, columns contiguous
+SURFACE_DTYPE = np.dtype([
+    ("strike", np.float64),
+    ("expiry", np.float64),
+    ("implied_vol", np.float64),
+    ("moneyness", np.float64),
+])
 
 
 class SurfaceService:
@@ -30,105 +34,122 @@ class SurfaceService:
     @staticmethod
     def build_vol_surface(request: VolSurfaceRequest) -> VolSurfaceResponse:
         """Build volatility surface from market data."""
-        ticker = yf.Ticker(request.symbol)
+        # Get all available expirations
+        expirations = yf_cache.get_options(request.symbol)
+        if not expirations:
+            raise ValueError(f"No options available for {request.symbol}")
 
-        # Get spot price
+        # Filter expirations by date range
+        days = days_to_expiries(expirations)
+        in_range = (days >= request.min_expiry_days) & (days <= request.max_expiry_days)
+        selected = [
+            (exp_str, exp_days / 365.25)
+            for exp_str, exp_days, keep in zip(expirations, days.tolist(), in_range.tolist())
+            if keep
+        ]
+
+        # Fetch all option chains concurrently; each call is a network round trip
+        chains = SurfaceService._fetch_chains(request.symbol, [exp_str for exp_str, _ in selected])
+
+        # Get spot price, from the first chain's underlying quote unless given
         if request.spot_price:
             spot_price = request.spot_price
         else:
-            info = ticker.info
-            spot_price = info.get("currentPrice") or info.get("regularMarketPrice", 0.0)
+            first_chain = next((chain for chain in chains if chain is not None), None)
+            spot_price = yf_cache.spot_price(request.symbol, first_chain)
 
         if spot_price == 0:
             raise ValueError(f"Could not fetch spot price for {request.symbol}")
 
-        # Get all available expirations
-        expirations = ticker.options
-        if not expirations:
-            raise ValueError(f"No options available for {request.symbol}")
-
-        surface_points: List[VolSurfacePoint] = []
-
-        # Filter expirations by date range
-        today = datetime.now()
-        for exp_str in expirations:
-            exp_date = datetime.strptime(exp_str, "%Y-%m-%d")
-            days_to_expiry = (exp_date - today).days
-
-            if days_to_expiry < request.min_expiry_days or days_to_expiry > request.max_expiry_days:
+        strike_blocks, expiry_blocks, iv_blocks = [], [], []
+        for (exp_str, time_to_expiry), chain in zip(selected, chains):
+            # Skip this expiration if its chain could not be fetched
+            if chain is None:
                 continue
 
-            time_to_expiry = days_to_expiry / 365.25
-
-            # Get option chain for this expiration
-            try:
-                chain = ticker.option_chain(exp_str)
-
-                # Process calls
-                for _, row in chain.calls.iterrows():
-                    iv = safe_float(row.get("impliedVolatility"))
-                    if iv is not None and iv > 0:
-                        strike = float(row["strike"])
-                        surface_points.append(
-                            VolSurfacePoint(
-                                strike=strike,
-                                expiry=time_to_expiry,
-                                implied_vol=iv,
-                                moneyness=strike / spot_price,
-                            )
-                        )
-
-                # Process puts
-                for _, row in chain.puts.iterrows():
-                    iv = safe_float(row.get("impliedVolatility"))
-                    if iv is not None and iv > 0:
-                        strike = float(row["strike"])
-                        surface_points.append(
-                            VolSurfacePoint(
-                                strike=strike,
-                                expiry=time_to_expiry,
-                                implied_vol=iv,
-                                moneyness=strike / spot_price,
-                            )
-                        )
-            except Exception as e:
-                # Skip this expiration if there's an error
-                continue
+            # Process calls and puts
+            for frame in (chain.calls, chain.puts):
+                strikes, ivs = SurfaceService._quoted_ivs(frame)
+                strike_blocks.append(strikes)
+                iv_blocks.append(ivs)
+                expiry_blocks.append(np.full(len(strikes), time_to_expiry))
 
-        if not surface_points:
+        n_points = sum(len(block) for block in strike_blocks)
+        if n_points == 0:
             raise ValueError(f"No valid surface points found for {request.symbol}")
 
+        points = np.empty(n_points, dtype=SURFACE_DTYPE)
+        points["strike"] = np.concatenate(strike_blocks)
+        points["expiry"] = np.concatenate(expiry_blocks)
+        points["implied_vol"] = np.concatenate(iv_blocks)
+        points["moneyness"] = points["strike"] / spot_price
+
         # Apply interpolation if requested
         if request.interpolate:
-            surface_points = SurfaceService._interpolate_surface(
-                surface_points, spot_price, request.grid_size
-            )
+            points = SurfaceService._interpolate_surface(points, spot_price, request.grid_size)
 
         # Count unique expirations and strikes
-        unique_expiries = len(set(p.expiry for p in surface_points))
-        unique_strikes = len(set(p.strike for p in surface_points))
+        unique_expiries = len(np.unique(points["expiry"]))
+        unique_strikes = len(np.unique(points["strike"]))
 
         return VolSurfaceResponse(
             symbol=request.symbol,
             spot_price=spot_price,
-            surface_points=surface_points,
+            strikes=points["strike"].tolist(),
+            expiries=points["expiry"].tolist(),
+            implied_vols=points["implied_vol"].tolist(),
+            moneyness=points["moneyness"].tolist(),
             num_expirations=unique_expiries,
             num_strikes=unique_strikes,
         )
 
+    @staticmethod
+    def _fetch_chains(symbol: str, expirations: List[str]) -> List[Optional[Tuple]]:
+        """
+        Fetch option chains for several expirations in parallel.
+
+        Returns one entry per expiration, in order; None where the fetch failed.
+        """
+        def fetch(exp_str):
+            try:
+                return yf_cache.get_option_chain(symbol, exp_str)
+            except Exception:
+                return None
+
+        if not expirations:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CHAIN_WORKERS, len(expirations))) as pool:
+            return list(pool.map(fetch, expirations))
+
+    @staticmethod
+    def _quoted_ivs(frame: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Strikes and implied vols of the rows with a positive vendor IV."""
+        if frame is None or "impliedVolatility" not in frame:
+            return np.empty(0), np.empty(0)
+        ivs = pd.to_numeric(frame["impliedVolatility"], errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        keep = ivs > 0  # NaN compares False
+        strikes = frame["strike"].to_numpy(dtype=np.float64)
+        return strikes[keep], ivs[keep]
+
     @staticmethod
     def _interpolate_surface(
-        raw_points: List[VolSurfacePoint], spot_price: float, grid_size: int = 30
-    ) -> List[VolSurfacePoint]:
-        """Interpolate volatility surface using RBF interpolation."""
-        if len(raw_points) < 4:
-            # Not enough points for interpolation
+        raw_points: np.ndarray, spot_price: float, grid_size: int = 30
+    ) -> np.ndarray:
+        """Interpolate the quoted points onto a regular moneyness x expiry grid."""
+        if len(raw_points) < MIN_INTERPOLATION_POINTS:
+            # Too few quotes to fit a surface through
             return raw_points
 
+        # A grid much finer than the quotes only adds extrapolated nodes
+        grid_size = min(grid_size, max(8, int(2 * np.sqrt(len(raw_points)))))
+
         # Extract data from raw points
-        moneyness = np.array([p.moneyness for p in raw_points])
-        expiry = np.array([p.expiry for p in raw_points])
-        iv = np.array([p.implied_vol for p in raw_points])
+        moneyness = raw_points["moneyness"]
+        expiry = raw_points["expiry"]
+        iv = raw_points["implied_vol"]
 
         # Create grid for interpolation
         moneyness_min, moneyness_max = moneyness.min(), moneyness.max()
@@ -152,134 +173,86 @@ class SurfaceService:
         # Create meshgrid
         M, E = np.meshgrid(moneyness_grid, expiry_grid)
 
-        # Interpolate using griddata with cubic method
-        try:
-            IV_grid = griddata(
-                (moneyness, expiry),
-                iv,
-                (M, E),
-                method='cubic',
-                fill_value=np.nan
-            )
+        # Quotes share strikes across expiries, so the points sit on a (mostly
+        # filled) rectangular expiry x moneyness mesh. Average calls and puts
+        # quoted at the same node and fill the holes along each axis.
+        expiry_nodes, expiry_idx = np.unique(expiry, return_inverse=True)
+        moneyness_nodes, moneyness_idx = np.unique(moneyness, return_inverse=True)
+        shape = (len(expiry_nodes), len(moneyness_nodes))
+        if min(shape) < 2:
+            # A single expiry or strike does not span a surface
+            return raw_points
 
-            # Fill NaN values with linear interpolation
-            nan_mask = np.isnan(IV_grid)
-            if nan_mask.any():
-                IV_linear = griddata(
-                    (moneyness, expiry),
-                    iv,
-                    (M, E),
-                    method='linear',
-                    fill_value=np.nan
-                )
-                IV_grid[nan_mask] = IV_linear[nan_mask]
-
-            # Fill remaining NaN values with nearest neighbor
-            nan_mask = np.isnan(IV_grid)
-            if nan_mask.any():
-                IV_nearest = griddata(
-                    (moneyness, expiry),
-                    iv,
-                    (M, E),
-                    method='nearest'
-                )
-                IV_grid[nan_mask] = IV_nearest[nan_mask]
-
-        except Exception:
-            # Fallback to linear interpolation
-            IV_grid = griddata(
-                (moneyness, expiry),
-                iv,
-                (M, E),
-                method='linear',
-                fill_value=np.nan
-            )
+        node = expiry_idx * shape[1] + moneyness_idx
+        counts = np.bincount(node, minlength=shape[0] * shape[1])
+        sums = np.bincount(node, weights=iv, minlength=shape[0] * shape[1])
+        with np.errstate(invalid="ignore"):
+            node_ivs = (sums / counts).reshape(shape)  # NaN where nothing is quoted
+
+        mesh = pd.DataFrame(node_ivs, index=expiry_nodes, columns=moneyness_nodes)
+        mesh = mesh.interpolate(method="index", axis=1, limit_direction="both")
+        mesh = mesh.interpolate(method="index", axis=0, limit_direction="both")
+
+        # Cubic needs four nodes per axis; linear covers the sparse surfaces
+        method = "cubic" if min(mesh.shape) >= 4 else "linear"
+        interpolator = RegularGridInterpolator(
+            (mesh.index.to_numpy(), mesh.columns.to_numpy()),
+            mesh.to_numpy(),
+            method=method,
+        )
+
+        # Grid nodes in the margin take the value at the nearest edge of the mesh
+        query = np.column_stack([
+            np.clip(E.ravel(), mesh.index[0], mesh.index[-1]),
+            np.clip(M.ravel(), mesh.columns[0], mesh.columns[-1]),
+        ])
+        IV_grid = interpolator(query).reshape(M.shape)
+
+        # Keep the grid nodes with a usable vol (NaN compares False)
+        valid = IV_grid > 0
+        if not valid.any():
+            return raw_points
 
-            # Fill NaN with nearest
-            nan_mask = np.isnan(IV_grid)
-            if nan_mask.any():
-                IV_nearest = griddata(
-                    (moneyness, expiry),
-                    iv,
-                    (M, E),
-                    method='nearest'
-                )
-                IV_grid[nan_mask] = IV_nearest[nan_mask]
-
-        # Convert grid back to list of points
-        interpolated_points = []
-        for i in range(grid_size):
-            for j in range(grid_size):
-                m = M[i, j]
-                e = E[i, j]
-                implied_vol = float(IV_grid[i, j])
-
-                # Skip invalid values
-                if np.isnan(implied_vol) or implied_vol <= 0:
-                    continue
-
-                strike = m * spot_price
-                interpolated_points.append(
-                    VolSurfacePoint(
-                        strike=strike,
-                        expiry=e,
-                        implied_vol=implied_vol,
-                        moneyness=m,
-                    )
-                )
-
-        return interpolated_points if interpolated_points else raw_points
+        grid_points = np.empty(int(valid.sum()), dtype=SURFACE_DTYPE)
+        grid_points["moneyness"] = M[valid]
+        grid_points["expiry"] = E[valid]
+        grid_points["implied_vol"] = IV_grid[valid]
+        grid_points["strike"] = grid_points["moneyness"] * spot_price
+        return grid_points
 
     @staticmethod
     def get_vol_smile(request: VolSmileRequest) -> VolSmileResponse:
         """Get volatility smile for a specific expiration."""
-        ticker = yf.Ticker(request.symbol)
-
-        # Get spot price
-        info = ticker.info
-        spot_price = info.get("currentPrice") or info.get("regularMarketPrice", 0.0)
-
         # Verify expiration exists
-        if request.expiration_date not in ticker.options:
+        if not yf_cache.has_expiration(request.symbol, request.expiration_date):
             raise ValueError(
                 f"Expiration {request.expiration_date} not available for {request.symbol}"
             )
 
         # Calculate time to expiry
-        exp_date = datetime.strptime(request.expiration_date, "%Y-%m-%d")
-        days_to_expiry = (exp_date - datetime.now()).days
-        time_to_expiry = days_to_expiry / 365.25
+        time_to_expiry = days_to_expiry(request.expiration) / 365.25
 
         # Get option chain
-        chain = ticker.option_chain(request.expiration_date)
-
-        strikes = []
-        implied_vols = []
-
-        # Combine calls and puts
-        for _, row in chain.calls.iterrows():
-            iv = safe_float(row.get("impliedVolatility"))
-            if iv is not None and iv > 0:
-                strikes.append(float(row["strike"]))
-                implied_vols.append(iv)
-
-        for _, row in chain.puts.iterrows():
-            iv = safe_float(row.get("impliedVolatility"))
-            if iv is not None and iv > 0:
-                strike = float(row["strike"])
-                if strike not in strikes:  # Avoid duplicates
-                    strikes.append(strike)
-                    implied_vols.append(iv)
-
-        # Sort by strike
-        sorted_data = sorted(zip(strikes, implied_vols))
-        strikes, implied_vols = zip(*sorted_data) if sorted_data else ([], [])
+        chain = yf_cache.get_option_chain(request.symbol, request.expiration_date)
+
+        # Get spot price from the chain's underlying quote
+        spot_price = yf_cache.spot_price(request.symbol, chain)
+
+        # Combine calls and puts; a strike quoted on both sides keeps the call IV
+        call_strikes, call_ivs = SurfaceService._quoted_ivs(chain.calls)
+        put_strikes, put_ivs = SurfaceService._quoted_ivs(chain.puts)
+        all_strikes = np.concatenate([call_strikes, put_strikes])
+        all_ivs = np.concatenate([call_ivs, put_ivs])
+
+        # np.unique sorts by strike and returns each strike's first occurrence
+        strikes, first = np.unique(all_strikes, return_index=True)
+        implied_vols = all_ivs[first]
 
         return VolSmileResponse(
             symbol=request.symbol,
             expiration_date=request.expiration_date,
             time_to_expiry=time_to_expiry,
             spot_price=spot_price,
-            strikes=list(strikes),
-            implied_vols=list(implied_vols),
+            strikes=strikes.tolist(),
+            implied_vols=implied_vols.tolist(),
         )
@@ -0,0 +1,117 @@
+"""
+Process-wide TTL caches around the yfinance network fetches shared by the services.
+
+Cache layering (every TTL derives from settings.CACHE_TTL_SECONDS):
+
+- The GET market endpoints (/market/overview, /charts, /ohlc) and
+  /data/expirations are response-cached for settings.CACHE_TTL_SECONDS.
+  That outer cache decides how fresh their data is; a response built from
+  these helpers can be up to CACHE_TTL_SECONDS + the inner TTL old.
+- The POST endpoints (smile, surface, calibration) have no response cache,
+  so for them the TTLs below are the only layer.
+- /data/option-chain bypasses this module for the chain and caches its
+  computed response in DataService instead.
+
+Chains and expiration lists use the response TTL itself. Quotes (info and
+history) use a tenth of it because the calibration spot lookups read them
+with no cache above. Under the market response cache the quote entries are
+mostly a second copy; the short TTL keeps the extra age they add small
+(a tenth of the response TTL) rather than doubling it.
+"""
+import functools
+import yfinance as yf
+from cachetools.func import ttl_cache
+from backend.core.config import settings
+
+
+CHAIN_CACHE_TTL_SECONDS = settings.CACHE_TTL_SECONDS
+QUOTE_CACHE_TTL_SECONDS = max(1, settings.CACHE_TTL_SECONDS // 10)
+
+
+def _ttl_cached(ttl: int, maxsize: int = 256):
+    """
+    Memoize a fetch for ttl seconds, bypassed when caching is disabled.
+
+    The underlying cachetools cache is locked, so the helpers can be called from
+    the endpoint worker threads. Failed fetches raise and are not cached. The
+    cached values (dicts and DataFrames) are shared between callers and must
+    not be mutated.
+    """
+    def decorator(fetch):
+        cached = ttl_cache(maxsize=maxsize, ttl=ttl)(fetch)
+
+        @functools.wraps(fetch)
+        def wrapper(*args):
+            if not settings.ENABLE_CACHE:
+                return fetch(*args)
+            return cached(*args)
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+@_ttl_cached(QUOTE_CACHE_TTL_SECONDS)
+def get_info(symbol: str) -> dict:
+    """Ticker info dict (spot price, volume, ...)."""
+    return yf.Ticker(symbol).info
+
+
+@_ttl_cached(QUOTE_CACHE_TTL_SECONDS)
+def get_history(symbol: str, period: str):
+    """Daily OHLCV history DataFrame for the given yfinance period string."""
+    return yf.Ticker(symbol).history(period=period)
+
+
+@_ttl_cached(QUOTE_CACHE_TTL_SECONDS)
+def download_history(symbols: tuple, period: str):
+    """History for several symbols in one request, columns grouped by ticker."""
+    return yf.download(
+        list(symbols), period=period, group_by="ticker", threads=True, progress=False
+    )
+
+
+@_ttl_cached(CHAIN_CACHE_TTL_SECONDS)
+def get_options(symbol: str) -> tuple:
+    """Listed option expirations as YYYY-MM-DD strings, nearest first."""
+    expirations = yf.Ticker(symbol).options
+    return tuple(expirations)
+
+
+@_ttl_cached(CHAIN_CACHE_TTL_SECONDS)
+def _expiration_set(symbol: str) -> frozenset:
+    return frozenset(get_options(symbol))
+
+
+def has_expiration(symbol: str, expiration: str) -> bool:
+    """Whether options are listed for the expiration (set lookup over the cached list)."""
+    return expiration in _expiration_set(symbol)
+
+
+@_ttl_cached(CHAIN_CACHE_TTL_SECONDS)
+def get_option_chain(symbol: str, expiration: str):
+    """
+    Option chain (calls and puts DataFrames) for one expiration.
+
+    yf.Ticker rewrites its expiration map and underlying quote on every
+    download, so each call (the surface service runs several in worker
+    threads) uses its own Ticker rather than sharing one.
+    """
+    return yf.Ticker(symbol).option_chain(expiration)
+
+
+def spot_price(symbol: str, chain=None) -> float:
+    """
+    Spot price of the underlying, 0.0 if unknown.
+
+    Read from the chain's underlying quote when a chain is at hand (it comes
+    with the options response), falling back to the ticker info request.
+    """
+    underlying = getattr(chain, "underlying", None) or {}
+    spot = underlying.get("regularMarketPrice") or underlying.get("last")
+    if spot:
+        return spot
+
+    info = get_info(symbol)
+    return info.get("currentPrice") or info.get("regularMarketPrice", 0.0)
@@ -1,29 +1,27 @@
 import React from 'react';
 import Plot from 'react-plotly.js';
-import { VolSurfacePoint } from '../../types/surface';
+import { VolSurfaceResponse } from '../../types/surface';
 
 interface VolSurface3DProps {
-  surfacePoints: VolSurfacePoint[];
-  symbol: string;
+  surface: VolSurfaceResponse;
 }
 
-const VolSurface3D: React.FC<VolSurface3DProps> = ({ surfacePoints, symbol }) => {
-  // Prepare data for 3D surface plot
-  const strikeSet = new Set(surfacePoints.map((p) => p.strike));
-  const strikes = Array.from(strikeSet).sort((a, b) => a - b);
+const VolSurface3D: React.FC<VolSurface3DProps> = ({ surface }) => {
+  const { symbol, strikes: pointStrikes, expiries: pointExpiries, implied_vols } = surface;
 
-  const expirySet = new Set(surfacePoints.map((p) => p.expiry));
-  const expiries = Array.from(expirySet).sort((a, b) => a - b);
+  // Prepare data for 3D surface plot
+  const strikes = Array.from(new Set(pointStrikes)).sort((a, b) => a - b);
+  const expiries = Array.from(new Set(pointExpiries)).sort((a, b) => a - b);
 
-  // Create z-matrix for surface
-  const zMatrix: (number | null)[][] = expiries.map((expiry) =>
-    strikes.map((strike) => {
-      const point = surfacePoints.find(
-        (p) => Math.abs(p.strike - strike) < 0.01 && Math.abs(p.expiry - expiry) < 0.001
-      );
-      return point ? point.implied_vol * 100 : null; // Convert to percentage
-    })
-  );
+  // Create z-matrix for surface, placing each point by its strike and expiry index
+  const strikeIndex = new Map(strikes.map((strike, j) => [strike, j]));
+  const expiryIndex = new Map(expiries.map((expiry, i) => [expiry, i]));
+  const zMatrix: (number | null)[][] = expiries.map(() => strikes.map(() => null));
+  implied_vols.forEach((iv, k) => {
+    const i = expiryIndex.get(pointExpiries[k])!;
+    const j = strikeIndex.get(pointStrikes[k])!;
+    zMatrix[i][j] = iv * 100; // Convert to percentage
+  });
 
   return (
     <Plot
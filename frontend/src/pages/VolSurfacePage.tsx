@@ -107,7 +107,7 @@ const VolSurfacePage: React.FC = () => {
               <strong>Mode:</strong> {interpolate ? 'Interpolated' : 'Raw Data'}
             </p>
           </div>
-          <VolSurface3D surfacePoints={surfaceData.surface_points} symbol={surfaceData.symbol} />
+          <VolSurface3D surface={surfaceData} />
         </>
       )}
     </div>
@@ -2,13 +2,6 @@
  * Volatility surface types
  */
 
-export interface VolSurfacePoint {
-  strike: number;
-  expiry: number;
-  implied_vol: number;
-  moneyness?: number;
-}
-
 export interface VolSurfaceRequest {
   symbol: string;
   spot_price?: number;
@@ -21,7 +14,11 @@ export interface VolSurfaceRequest {
 export interface VolSurfaceResponse {
   symbol: string;
   spot_price: number;
-  surface_points: VolSurfacePoint[];
+  // Column-wise points: index i across the four arrays is one surface point
+  strikes: number[];
+  expiries: number[];
+  implied_vols: number[];
+  moneyness: number[];
   num_expirations: number;
   num_strikes: number;
 }
@@ -12,7 +12,9 @@ def option_chain_puller(ticker_symbol, output_file=None):
     ticker_symbol : str
         The stock ticker symbol (e.g., 'AAPL', 'TSLA')
     output_file : str, optional
-        Path to save the CSV file. If None, returns the dataframe without saving.
+        Path to save the data to. Files ending in .csv are written as CSV,
+        anything else as zstd-compressed Parquet. If None, returns the
+        dataframe without saving.
 
     Returns:
     --------
@@ -54,12 +56,16 @@ def option_chain_puller(ticker_symbol, output_file=None):
         options_df = pd.concat([calls, puts], ignore_index=True)
 
         # Reorder columns to put identifying info first
-        cols = ['ticker', 'expirationDate', 'optionType'] + [col for col in options_df.columns if col not in ['ticker', 'expirationDate', 'optionType']]
-        options_df = options_df[cols]
+        id_cols = ['ticker', 'expirationDate', 'optionType']
+        options_df = options_df.reindex(columns=id_cols + options_df.columns.drop(id_cols).tolist())
 
-        # Save to CSV if output file is specified
+        # Save if output file is specified; Parquet writes the columns in bulk and
+        # compresses them, where CSV formats every value as text
         if output_file:
-            options_df.to_csv(output_file, index=False)
+            if str(output_file).endswith('.csv'):
+                options_df.to_csv(output_file, index=False)
+            else:
+                options_df.to_parquet(output_file, index=False, compression='zstd')
             print(f"Option chain data saved to {output_file}")
 
         return options_df
@@ -71,11 +77,11 @@ def option_chain_puller(ticker_symbol, output_file=None):
 
 # Example usage
 if __name__ == "__main__":
-    # Pull option chain for Apple (AAPL) and save to CSV
+    # Pull option chain for Apple (AAPL) and save to Parquet
     ticker = "AAPL"
-    output_csv = f"{ticker}_option_chain_{datetime.now().strftime('%Y%m%d')}.csv"
+    output_file = f"{ticker}_option_chain_{datetime.now().strftime('%Y%m%d')}.parquet"
 
-    df = option_chain_puller(ticker, output_csv)
+    df = option_chain_puller(ticker, output_file)
 
     print(f"\nOption Chain Summary for {ticker}:")
     print(f"Total options: {len(df)}")
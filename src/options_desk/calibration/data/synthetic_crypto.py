@@ -22,10 +22,10 @@ import pandas as pd
 from datetime import date, timedelta
 from typing import List, Dict, Optional, TYPE_CHECKING
 from dataclasses import dataclass
-from scipy.stats import norm
 import warnings
 
 from .data_provider import OptionChain, OptionQuote
+from options_desk.pricer.black_scholes import black_scholes_price, black_scholes_vega
 
 if TYPE_CHECKING:
     from ..risk_neutral.regime_switching_heston_calibrator import RegimeSwitchingHestonResult
@@ -416,17 +416,11 @@ class SyntheticOptionChainGenerator:
         iv: float,
         is_call: bool,
     ) -> tuple[float, float]:
-        """Compute BS price and vega together (efficient)."""
-        d1 = (np.log(S / K) + (r + 0.5 * iv**2) * T) / (iv * np.sqrt(T))
-        d2 = d1 - iv * np.sqrt(T)
-
-        if is_call:
-            price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-        else:
-            price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
-
-        vega = S * norm.pdf(d1) * np.sqrt(T)
-        return price, vega
+        """Compute BS price and vega (no dividend yield)."""
+        return (
+            black_scholes_price(S, K, T, r, 0.0, iv, is_call),
+            black_scholes_vega(S, K, T, r, 0.0, iv),
+        )
 
     def _black_scholes_iv(
         self,
@@ -19,11 +19,11 @@ import pandas as pd
 from datetime import date, timedelta
 from typing import List, Dict, Optional
 from dataclasses import dataclass
-from scipy.stats import norm
 from scipy.integrate import quad
 import warnings
 
 from .data_provider import OptionChain, OptionQuote
+from options_desk.pricer.black_scholes import black_scholes_price, black_scholes_vega
 try:
     from options_desk.pricer._jax_mgf_pricer import heston_price_slice_fast as heston_price_slice
     from options_desk.pricer.heston_mgf_pricer import heston_price_vanilla
@@ -555,16 +555,10 @@ class SyntheticEquityOptionChainGenerator:
         is_call: bool,
     ) -> tuple:
         """BS price and vega."""
-        d1 = (np.log(S / K) + (r - q + 0.5 * iv**2) * T) / (iv * np.sqrt(T))
-        d2 = d1 - iv * np.sqrt(T)
-
-        if is_call:
-            price = S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-        else:
-            price = K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(-q * T) * norm.cdf(-d1)
-
-        vega = S * np.exp(-q * T) * norm.pdf(d1) * np.sqrt(T)
-        return price, vega
+        return (
+            black_scholes_price(S, K, T, r, q, iv, is_call),
+            black_scholes_vega(S, K, T, r, q, iv),
+        )
 
     def _black_scholes_iv(
         self,
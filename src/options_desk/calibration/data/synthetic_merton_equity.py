@@ -9,6 +9,7 @@ from dataclasses import dataclass
 import warnings
 
 from .data_provider import OptionChain, OptionQuote
+from options_desk.pricer.black_scholes import black_scholes_price, black_scholes_vega
 from options_desk.pricer.merton_mgf_pricer import merton_price_slice
 
 
@@ -229,22 +230,11 @@ class SyntheticMertonOptionChainGenerator:
         iv: float,
         is_call: bool,
     ) -> tuple:
-        if T <= 0:
-            intrinsic = max(S - K, 0) if is_call else max(K - S, 0)
-            return intrinsic, 0.0
-
-        sqrt_T = np.sqrt(T)
-        d1 = (np.log(S / K) + (r - q + 0.5 * iv**2) * T) / (iv * sqrt_T)
-        d2 = d1 - iv * sqrt_T
-
-        from scipy.stats import norm
-        if is_call:
-            price = S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-        else:
-            price = K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(-q * T) * norm.cdf(-d1)
-
-        vega = S * np.exp(-q * T) * norm.pdf(d1) * sqrt_T
-        return price, vega
+        # Intrinsic value and zero vega once T <= 0
+        return (
+            black_scholes_price(S, K, T, r, q, iv, is_call),
+            black_scholes_vega(S, K, T, r, q, iv),
+        )
 
     def _compute_bid_ask_spread(self, price: float, moneyness: float, T: float) -> float:
         # Wider spreads for deep OTM and short maturity
@@ -26,6 +26,20 @@ from .heston_mgf_pricer import heston_price_vanilla, heston_price_slice
 from .merton_mgf_pricer import merton_price_vanilla, merton_price_slice
 from .bachelier_pricer import bachelier_price_vanilla, bachelier_price_slice
 
+# Vectorized Black-Scholes closed form
+from .black_scholes import (
+    black_scholes_price,
+    black_scholes_price_slice,
+    black_scholes_delta,
+    black_scholes_gamma,
+    black_scholes_vega,
+    black_scholes_theta,
+    black_scholes_all,
+    black_scholes_implied_vol,
+    BlackScholesGreeks,
+)
+from .book import OptionBook
+
 __all__ = [
     # Base
     "Pricer",
@@ -51,6 +65,17 @@ __all__ = [
     # Bachelier
     "bachelier_price_vanilla",
     "bachelier_price_slice",
+    # Black-Scholes
+    "black_scholes_price",
+    "black_scholes_price_slice",
+    "black_scholes_delta",
+    "black_scholes_gamma",
+    "black_scholes_vega",
+    "black_scholes_theta",
+    "black_scholes_all",
+    "black_scholes_implied_vol",
+    "BlackScholesGreeks",
+    "OptionBook",
 ]
 
 # --- JAX-accelerated pricers (optional, require jax) ---
@@ -0,0 +1,133 @@
+"""
+Numba-compiled Black-Scholes kernels (optional, requires numba).
+
+The backend pricing endpoints (backend/services/bs_kernels.py) build on the
+same normal CDF and price kernel.
+
+Loop-style scalar code: for a single option, math.* calls in a compiled
+function beat the NumPy expression path, which allocates a 0-d array for
+every intermediate. The same kernel is compiled as a parallel ufunc for
+arrays, splitting a book across NUMBA_NUM_THREADS threads without the GIL
+and without NumPy's temporary per intermediate.
+"""
+
+import math
+
+from numba import njit, vectorize
+
+from ._normal import INV_SQRT_2, INV_SQRT_2PI
+
+
+@njit(cache=True, fastmath=True)
+def norm_cdf(x):
+    """Standard normal CDF via erfc (accurate in both tails, unlike A&S 26.2.17)."""
+    return 0.5 * math.erfc(-x * INV_SQRT_2)
+
+
+@njit(cache=True, fastmath=True)
+def norm_pdf(x):
+    """Standard normal PDF."""
+    return INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+@njit(cache=True, fastmath=True)
+def bs_price_scalar(S, K, T, r, q, sigma, is_call):
+    """Black-Scholes price of one European option; intrinsic value once expired."""
+    if T <= 0.0:
+        return max(S - K, 0.0) if is_call else max(K - S, 0.0)
+
+    sqrt_t = math.sqrt(T)
+    total_vol = sigma * sqrt_t
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / total_vol
+    d2 = d1 - total_vol
+
+    disc_spot = S * math.exp(-q * T)
+    disc_strike = K * math.exp(-r * T)
+    if is_call:
+        return disc_spot * norm_cdf(d1) - disc_strike * norm_cdf(d2)
+    return disc_strike * norm_cdf(-d2) - disc_spot * norm_cdf(-d1)
+
+
+@vectorize(
+    ["float64(float64, float64, float64, float64, float64, float64, boolean)"],
+    target="parallel",
+    fastmath=True,
+    cache=True,
+)
+def bs_price_ufunc(S, K, T, r, q, sigma, is_call):
+    """bs_price_scalar as a broadcasting NumPy ufunc."""
+    return bs_price_scalar(S, K, T, r, q, sigma, is_call)
+
+
+# Volatility bracket of the implied-vol search
+SIGMA_LO = 1e-4
+SIGMA_HI = 5.0
+
+
+# No fastmath: it lets LLVM assume no NaNs, and the bound checks must reject NaN quotes
+@njit(cache=True)
+def bs_implied_vol_scalar(price, S, K, T, r, q, is_call, tol, max_iter):
+    """
+    Black-Scholes implied volatility of one quote to within tol (in volatility);
+    NaN outside the no-arbitrage bounds or if Newton does not converge.
+
+    sqrt(T), both discounted legs and log(F / K) are computed once, so an
+    iteration costs one exp and two erfc. Newton starts at the inflection
+    point sqrt(2 |log(F / K)| / T) and bisects whenever a step leaves the
+    current bracket.
+    """
+    if not (T > 0.0 and S > 0.0 and K > 0.0):
+        return math.nan
+
+    sqrt_t = math.sqrt(T)
+    disc_spot = S * math.exp(-q * T)
+    disc_strike = K * math.exp(-r * T)
+    log_fk = math.log(disc_spot / disc_strike)
+    omega = 1.0 if is_call else -1.0
+
+    lower = max(omega * (disc_spot - disc_strike), 0.0)
+    upper = disc_spot if is_call else disc_strike
+    if not (lower < price < upper):
+        return math.nan
+
+    sigma = math.sqrt(2.0 * abs(log_fk) / T) if abs(log_fk) > 1e-6 else 0.2
+    sigma = min(max(sigma, 2.0 * SIGMA_LO), 0.5 * SIGMA_HI)
+    lo = SIGMA_LO
+    hi = SIGMA_HI
+
+    for _ in range(max_iter):
+        total_vol = sigma * sqrt_t
+        d1 = log_fk / total_vol + 0.5 * total_vol
+        d2 = d1 - total_vol
+        model = disc_spot * norm_cdf(omega * d1) - disc_strike * norm_cdf(omega * d2)
+        diff = omega * model - price
+        vega = disc_spot * math.exp(-0.5 * d1 * d1) * INV_SQRT_2PI * sqrt_t
+
+        # Converged once the Newton step (in volatility) is below tol
+        if abs(diff) < tol * vega:
+            return sigma
+
+        # Price is increasing in sigma, so the sign of diff tightens the bracket
+        if diff > 0.0:
+            hi = sigma
+        else:
+            lo = sigma
+        if hi - lo < tol:
+            return 0.5 * (lo + hi)
+
+        step = sigma - diff / vega if vega > 1e-12 else 0.5 * (lo + hi)
+        if not (lo < step < hi):
+            step = 0.5 * (lo + hi)
+        sigma = step
+
+    return math.nan
+
+
+@vectorize(
+    ["float64(float64, float64, float64, float64, float64, float64, boolean, float64, int64)"],
+    target="parallel",
+    cache=True,
+)
+def bs_implied_vol_ufunc(price, S, K, T, r, q, is_call, tol, max_iter):
+    """bs_implied_vol_scalar as a broadcasting NumPy ufunc."""
+    return bs_implied_vol_scalar(price, S, K, T, r, q, is_call, tol, max_iter)
@@ -0,0 +1,8 @@
+"""
+Standard normal constants shared by the closed-form pricers and their kernels.
+"""
+
+import math
+
+INV_SQRT_2 = math.sqrt(0.5)
+INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
@@ -4,12 +4,34 @@ Analytical pricing formulas (closed-form solutions)
 author: Yunian Pan
 email: yp1170@nyu.edu
 """
+import math
 import numpy as np
-from scipy import stats
 import time
 from typing import Union
 
 from .base import Pricer, PricingResult
+from ._normal import INV_SQRT_2, INV_SQRT_2PI
+
+
+# BlackScholesPricer works on one option at a time, so its formulas use math.*
+# on Python floats rather than NumPy ufuncs (which wrap every scalar in a 0-d
+# array and dispatch through the ufunc machinery).
+
+def _norm_pdf(x: float) -> float:
+    """Standard normal density."""
+    return math.exp(-0.5 * x * x) * INV_SQRT_2PI
+
+
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF via erfc (accurate in both tails)."""
+    return 0.5 * math.erfc(-x * INV_SQRT_2)
+
+
+def _d1_d2(S0: float, K: float, T: float, r: float, q: float, sigma: float):
+    """Black-Scholes d1 and d2 for scalar inputs."""
+    total_vol = sigma * math.sqrt(T)
+    d1 = (math.log(S0 / K) + (r - q + 0.5 * sigma * sigma) * T) / total_vol
+    return d1, d1 - total_vol
 
 
 class BlackScholesPricer(Pricer):
@@ -76,8 +98,11 @@ class BlackScholesPricer(Pricer):
         # Determine option type
         contract_type = derivative.contract_type
 
-        # Price the option
-        if "call" in contract_type and "digital" not in contract_type:
+        # Price the option (at expiry the formulas divide by zero; use the payoff)
+        if T <= 0:
+            price = float(derivative.payoff(S0))
+            compute_greeks = False
+        elif "call" in contract_type and "digital" not in contract_type:
             price = self._bs_call(S0, K, T, r, q, sigma)
         elif "put" in contract_type and "digital" not in contract_type:
             price = self._bs_put(S0, K, T, r, q, sigma)
@@ -117,29 +142,27 @@ class BlackScholesPricer(Pricer):
 
     def _bs_call(self, S0: float, K: float, T: float, r: float, q: float, sigma: float) -> float:
         """Black-Scholes call option price"""
-        d1 = (np.log(S0 / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        d1, d2 = _d1_d2(S0, K, T, r, q, sigma)
 
-        call_price = S0 * np.exp(-q * T) * stats.norm.cdf(d1) - K * np.exp(-r * T) * stats.norm.cdf(d2)
+        call_price = S0 * math.exp(-q * T) * _norm_cdf(d1) - K * math.exp(-r * T) * _norm_cdf(d2)
         return call_price
 
     def _bs_put(self, S0: float, K: float, T: float, r: float, q: float, sigma: float) -> float:
         """Black-Scholes put option price"""
-        d1 = (np.log(S0 / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        d1, d2 = _d1_d2(S0, K, T, r, q, sigma)
 
-        put_price = K * np.exp(-r * T) * stats.norm.cdf(-d2) - S0 * np.exp(-q * T) * stats.norm.cdf(-d1)
+        put_price = K * math.exp(-r * T) * _norm_cdf(-d2) - S0 * math.exp(-q * T) * _norm_cdf(-d1)
         return put_price
 
     def _digital_call(self, S0: float, K: float, T: float, r: float, q: float, sigma: float) -> float:
         """Digital call option price (cash-or-nothing)"""
-        d2 = (np.log(S0 / K) + (r - q - 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        return np.exp(-r * T) * stats.norm.cdf(d2)
+        _, d2 = _d1_d2(S0, K, T, r, q, sigma)
+        return math.exp(-r * T) * _norm_cdf(d2)
 
     def _digital_put(self, S0: float, K: float, T: float, r: float, q: float, sigma: float) -> float:
         """Digital put option price (cash-or-nothing)"""
-        d2 = (np.log(S0 / K) + (r - q - 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        return np.exp(-r * T) * stats.norm.cdf(-d2)
+        _, d2 = _d1_d2(S0, K, T, r, q, sigma)
+        return math.exp(-r * T) * _norm_cdf(-d2)
 
     def _compute_greeks(
         self, S0: float, K: float, T: float, r: float, q: float, sigma: float, contract_type: str
@@ -156,37 +179,39 @@ class BlackScholesPricer(Pricer):
         """
         greeks = {}
 
-        d1 = (np.log(S0 / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        d1, d2 = _d1_d2(S0, K, T, r, q, sigma)
 
         # Common terms
-        pdf_d1 = stats.norm.pdf(d1)
-        cdf_d1 = stats.norm.cdf(d1)
-        cdf_d2 = stats.norm.cdf(d2)
+        sqrt_t = math.sqrt(T)
+        df_q = math.exp(-q * T)
+        df_r = math.exp(-r * T)
+        pdf_d1 = _norm_pdf(d1)
+        cdf_d1 = _norm_cdf(d1)
+        cdf_d2 = _norm_cdf(d2)
 
         if "call" in contract_type and "digital" not in contract_type:
             # Call Greeks
-            greeks['delta'] = np.exp(-q * T) * cdf_d1
-            greeks['gamma'] = np.exp(-q * T) * pdf_d1 / (S0 * sigma * np.sqrt(T))
-            greeks['vega'] = S0 * np.exp(-q * T) * pdf_d1 * np.sqrt(T)
+            greeks['delta'] = df_q * cdf_d1
+            greeks['gamma'] = df_q * pdf_d1 / (S0 * sigma * sqrt_t)
+            greeks['vega'] = S0 * df_q * pdf_d1 * sqrt_t
             greeks['theta'] = (
-                -S0 * pdf_d1 * sigma * np.exp(-q * T) / (2 * np.sqrt(T))
-                - r * K * np.exp(-r * T) * cdf_d2
-                + q * S0 * np.exp(-q * T) * cdf_d1
+                -S0 * pdf_d1 * sigma * df_q / (2 * sqrt_t)
+                - r * K * df_r * cdf_d2
+                + q * S0 * df_q * cdf_d1
             )
-            greeks['rho'] = K * T * np.exp(-r * T) * cdf_d2
+            greeks['rho'] = K * T * df_r * cdf_d2
 
         elif "put" in contract_type and "digital" not in contract_type:
             # Put Greeks
-            greeks['delta'] = -np.exp(-q * T) * stats.norm.cdf(-d1)
-            greeks['gamma'] = np.exp(-q * T) * pdf_d1 / (S0 * sigma * np.sqrt(T))
-            greeks['vega'] = S0 * np.exp(-q * T) * pdf_d1 * np.sqrt(T)
+            greeks['delta'] = -df_q * _norm_cdf(-d1)
+            greeks['gamma'] = df_q * pdf_d1 / (S0 * sigma * sqrt_t)
+            greeks['vega'] = S0 * df_q * pdf_d1 * sqrt_t
             greeks['theta'] = (
-                -S0 * pdf_d1 * sigma * np.exp(-q * T) / (2 * np.sqrt(T))
-                + r * K * np.exp(-r * T) * stats.norm.cdf(-d2)
-                - q * S0 * np.exp(-q * T) * stats.norm.cdf(-d1)
+                -S0 * pdf_d1 * sigma * df_q / (2 * sqrt_t)
+                + r * K * df_r * _norm_cdf(-d2)
+                - q * S0 * df_q * _norm_cdf(-d1)
             )
-            greeks['rho'] = -K * T * np.exp(-r * T) * stats.norm.cdf(-d2)
+            greeks['rho'] = -K * T * df_r * _norm_cdf(-d2)
 
         # Normalize vega (typically reported per 1% change in volatility)
         if 'vega' in greeks:
@@ -230,7 +255,7 @@ class BlackScholesPricer(Pricer):
         contract_type = derivative.contract_type
 
         # Initial guess: ATM volatility approximation
-        sigma = np.sqrt(2 * np.pi / T) * market_price / S0
+        sigma = math.sqrt(2 * math.pi / T) * market_price / S0
 
         for i in range(max_iterations):
             # Price and vega at current sigma
@@ -240,8 +265,8 @@ class BlackScholesPricer(Pricer):
                 price = self._bs_put(S0, K, T, r, q, sigma)
 
             # Vega
-            d1 = (np.log(S0 / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-            vega = S0 * np.exp(-q * T) * stats.norm.pdf(d1) * np.sqrt(T)
+            d1, _ = _d1_d2(S0, K, T, r, q, sigma)
+            vega = S0 * math.exp(-q * T) * _norm_pdf(d1) * math.sqrt(T)
 
             # Newton-Raphson update
             price_diff = price - market_price
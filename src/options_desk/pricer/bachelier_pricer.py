@@ -15,7 +15,14 @@ email: yp1170@nyu.edu
 """
 
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
+
+from ._normal import INV_SQRT_2PI
+
+
+def _norm_pdf(x):
+    """Standard normal density without scipy.stats' distribution dispatch."""
+    return np.exp(-0.5 * x * x) * INV_SQRT_2PI
 
 
 # ============================================================================
@@ -54,7 +61,7 @@ def bachelier_call(forward: float,
     total_vol = sigma_n * sqrt_t
     d = (forward - strike) / total_vol
 
-    price = discfactor * ((forward - strike) * norm.cdf(d) + total_vol * norm.pdf(d))
+    price = discfactor * ((forward - strike) * ndtr(d) + total_vol * _norm_pdf(d))
     return float(price)
 
 
@@ -90,7 +97,7 @@ def bachelier_put(forward: float,
     total_vol = sigma_n * sqrt_t
     d = (forward - strike) / total_vol
 
-    price = discfactor * ((strike - forward) * norm.cdf(-d) + total_vol * norm.pdf(d))
+    price = discfactor * ((strike - forward) * ndtr(-d) + total_vol * _norm_pdf(d))
     return float(price)
 
 
@@ -213,9 +220,9 @@ def bachelier_delta(forward: float,
     d = (forward - strike) / total_vol
 
     if is_call:
-        return discfactor * norm.cdf(d)
+        return discfactor * ndtr(d)
     else:
-        return -discfactor * norm.cdf(-d)
+        return -discfactor * ndtr(-d)
 
 
 def bachelier_gamma(forward: float,
@@ -244,7 +251,7 @@ def bachelier_gamma(forward: float,
     total_vol = sigma_n * np.sqrt(ttm)
     d = (forward - strike) / total_vol
 
-    return discfactor * norm.pdf(d) / total_vol
+    return discfactor * _norm_pdf(d) / total_vol
 
 
 def bachelier_vega(forward: float,
@@ -274,7 +281,7 @@ def bachelier_vega(forward: float,
     total_vol = sigma_n * sqrt_t
     d = (forward - strike) / total_vol
 
-    return discfactor * sqrt_t * norm.pdf(d)
+    return discfactor * sqrt_t * _norm_pdf(d)
 
 
 def bachelier_theta(forward: float,
@@ -308,7 +315,7 @@ def bachelier_theta(forward: float,
     total_vol = sigma_n * sqrt_t
     d = (forward - strike) / total_vol
 
-    return -discfactor * sigma_n * norm.pdf(d) / (2.0 * sqrt_t)
+    return -discfactor * sigma_n * _norm_pdf(d) / (2.0 * sqrt_t)
 
 
 # ============================================================================
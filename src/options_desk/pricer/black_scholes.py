@@ -0,0 +1,410 @@
+"""
+Black-Scholes Option Pricer
+
+Closed-form prices and Greeks, and implied volatilities, for European options
+when the underlying follows geometric Brownian motion with a continuous
+dividend yield:
+
+    dS_t = (r - q) * S_t * dt + sigma * S_t * dW_t
+
+Every function broadcasts over NumPy arrays of spots, strikes, maturities,
+volatilities and call flags, so a whole book is priced in one call instead of
+a Python loop over scalar pricings. Scalar inputs return a float; when numba
+is installed, black_scholes_price runs a compiled kernel instead (a parallel
+ufunc for arrays).
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+from scipy.special import ndtr
+
+from ._normal import INV_SQRT_2PI
+
+try:
+    from ._bs_numba import (
+        bs_price_scalar as _bs_price_scalar,
+        bs_price_ufunc as _bs_price_ufunc,
+        bs_implied_vol_ufunc as _bs_implied_vol_ufunc,
+    )
+except ImportError:
+    _bs_price_scalar = _bs_price_ufunc = _bs_implied_vol_ufunc = None
+
+
+# Python and NumPy scalars routed to the compiled scalar kernel (bool is an int)
+_SCALAR_TYPES = (float, int, np.floating, np.integer, np.bool_)
+
+# Volatility bracket of the implied-vol search (same as the numba kernel)
+_SIGMA_LO = 1e-4
+_SIGMA_HI = 5.0
+
+
+def _result(value):
+    """Return a float for scalar inputs and the array otherwise."""
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def _omega(is_call):
+    """Payoff sign w: +1.0 for calls, -1.0 for puts."""
+    return np.where(is_call, 1.0, -1.0)
+
+
+def _expired_mask(T):
+    """
+    Lanes at or past expiry (T <= 0), or None when every lane is live.
+
+    The closed form is evaluated for all lanes (expired ones come out
+    non-finite) and only a book that holds expired options pays for the
+    np.where that swaps in the at-expiry values.
+    """
+    expired = ~(T > 0)
+    return expired if expired.any() else None
+
+
+def _expired_delta(S, K, omega):
+    """Intrinsic payoff slope at expiry: w in the money, 0 otherwise."""
+    return omega * (omega * (S - K) > 0)
+
+
+def _at_expiry(value, expired, expired_value, out):
+    """Swap the at-expiry values into expired lanes, in place when writing into out."""
+    if out is None:
+        return np.where(expired, expired_value, value)
+    np.copyto(out, expired_value, where=expired)
+    return out
+
+
+def _d1_d2(S, K, T, r, q, sigma):
+    """d1, d2 and sqrt(T) for broadcast inputs (non-finite where T <= 0)."""
+    sqrt_t = np.sqrt(T)
+    total_vol = sigma * sqrt_t
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / total_vol
+    return d1, d1 - total_vol, sqrt_t
+
+
+# ============================================================================
+# Black-Scholes price
+# ============================================================================
+
+def black_scholes_price(S, K, T, r, q, sigma, is_call, out=None):
+    """
+    Black-Scholes price of European calls and puts.
+
+    V = w * [S * exp(-qT) * N(w * d1) - K * exp(-rT) * N(w * d2)]
+
+    with w = +1 for calls and -1 for puts, so a mixed book is priced with a
+    single formula instead of evaluating both legs and selecting. Expired
+    options (T <= 0) are worth their intrinsic value.
+
+    Args:
+        S: Spot price(s)
+        K: Strike price(s)
+        T: Time(s) to maturity in years
+        r: Risk-free rate(s)
+        q: Dividend yield(s)
+        sigma: Volatility(ies)
+        is_call: True for calls, False for puts (scalar or array)
+        out: Optional float64 array of the broadcast shape to write the
+            prices into (NumPy ufunc convention), e.g. reused across the
+            iterations of a calibration loop
+
+    Returns:
+        Option price(s), broadcast over the inputs; ``out`` when given
+    """
+    if _bs_price_scalar is not None:
+        args = (S, K, T, r, q, sigma, is_call)
+        if out is None and all(isinstance(x, _SCALAR_TYPES) for x in args):
+            return _bs_price_scalar(
+                float(S), float(K), float(T), float(r), float(q), float(sigma), bool(is_call)
+            )
+        price = _bs_price_ufunc(S, K, T, r, q, sigma, np.asarray(is_call, dtype=bool), out=out)
+        return price if out is not None else _result(price)
+
+    S, K, T, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, sigma))
+    omega = _omega(is_call)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, d2, _ = _d1_d2(S, K, T, r, q, sigma)
+        disc_spot = S * np.exp(-q * T)
+        disc_strike = K * np.exp(-r * T)
+        price = np.multiply(
+            omega, disc_spot * ndtr(omega * d1) - disc_strike * ndtr(omega * d2), out=out
+        )
+
+    expired = _expired_mask(T)
+    if expired is not None:
+        price = _at_expiry(price, expired, np.maximum(omega * (S - K), 0.0), out)
+    return price if out is not None else _result(price)
+
+
+def black_scholes_price_slice(S: float,
+                              strikes: np.ndarray,
+                              T: float,
+                              r: float,
+                              q: float,
+                              sigma,
+                              option_types: np.ndarray) -> np.ndarray:
+    """
+    Price multiple options at the same maturity.
+
+    The expiry invariants (forward, discount factor, sqrt(T)) are computed
+    once as scalars, so each strike only costs a log and two ndtr calls:
+
+        C = D * [F * N(d1) - K * N(d2)],  d1 = log(F / K) / v + v / 2
+
+    with v = sigma * sqrt(T).
+
+    Args:
+        S: Spot price
+        strikes: Array of strike prices
+        T: Time to maturity (years)
+        r: Risk-free rate
+        q: Dividend yield
+        sigma: Volatility, scalar or one per strike (smile)
+        option_types: Array of 'call' or 'put'
+
+    Returns:
+        Array of option prices
+    """
+    strikes = np.asarray(strikes, dtype=np.float64)
+    omega = _omega(np.asarray(option_types) == 'call')
+
+    if T <= 0:
+        return np.maximum(omega * (S - strikes), 0.0)
+
+    forward = S * np.exp((r - q) * T)
+    discfactor = np.exp(-r * T)
+    total_vol = np.asarray(sigma, dtype=np.float64) * np.sqrt(T)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = np.log(forward / strikes) / total_vol + 0.5 * total_vol
+        d2 = d1 - total_vol
+        return omega * discfactor * (forward * ndtr(omega * d1) - strikes * ndtr(omega * d2))
+
+
+# ============================================================================
+# Black-Scholes Greeks
+# ============================================================================
+
+def black_scholes_delta(S, K, T, r, q, sigma, is_call):
+    """
+    Black-Scholes delta dV/dS.
+
+    Delta = w * exp(-qT) * N(w * d1),  w = +1 (call) / -1 (put)
+
+    At expiry the delta is the intrinsic payoff slope (1 / -1 in the money,
+    0 otherwise).
+    """
+    S, K, T, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, sigma))
+    omega = _omega(is_call)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, _, _ = _d1_d2(S, K, T, r, q, sigma)
+        delta = omega * np.exp(-q * T) * ndtr(omega * d1)
+
+    expired = _expired_mask(T)
+    if expired is not None:
+        delta = np.where(expired, _expired_delta(S, K, omega), delta)
+    return _result(delta)
+
+
+def black_scholes_gamma(S, K, T, r, q, sigma):
+    """
+    Black-Scholes gamma d^2V/dS^2 (same for calls and puts).
+
+    Gamma = exp(-qT) * n(d1) / (S * sigma * sqrt(T))
+    """
+    S, K, T, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, sigma))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, _, sqrt_t = _d1_d2(S, K, T, r, q, sigma)
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+        gamma = np.exp(-q * T) * pdf_d1 / (S * sigma * sqrt_t)
+
+    expired = _expired_mask(T)
+    if expired is not None:
+        gamma = np.where(expired, 0.0, gamma)
+    return _result(gamma)
+
+
+def black_scholes_vega(S, K, T, r, q, sigma):
+    """
+    Black-Scholes vega dV/dsigma (same for calls and puts).
+
+    Vega = S * exp(-qT) * n(d1) * sqrt(T)
+
+    Per unit of volatility, not per 1% move.
+    """
+    S, K, T, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, sigma))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, _, sqrt_t = _d1_d2(S, K, T, r, q, sigma)
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+        vega = S * np.exp(-q * T) * pdf_d1 * sqrt_t
+
+    expired = _expired_mask(T)
+    if expired is not None:
+        vega = np.where(expired, 0.0, vega)
+    return _result(vega)
+
+
+def black_scholes_theta(S, K, T, r, q, sigma, is_call):
+    """
+    Black-Scholes theta -dV/dT (time decay per year).
+
+    Theta = -S e^{-qT} n(d1) sigma / (2 sqrt(T))
+            - w r K e^{-rT} N(w d2) + w q S e^{-qT} N(w d1)
+
+    with w = +1 for calls and -1 for puts.
+    """
+    S, K, T, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, sigma))
+    omega = _omega(is_call)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, d2, sqrt_t = _d1_d2(S, K, T, r, q, sigma)
+        disc_spot = S * np.exp(-q * T)
+        disc_strike = K * np.exp(-r * T)
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+        decay = -disc_spot * pdf_d1 * sigma / (2.0 * sqrt_t)
+        carry = r * disc_strike * ndtr(omega * d2) - q * disc_spot * ndtr(omega * d1)
+        theta = decay - omega * carry
+
+    expired = _expired_mask(T)
+    if expired is not None:
+        theta = np.where(expired, 0.0, theta)
+    return _result(theta)
+
+
+# ============================================================================
+# Fused price and Greeks
+# ============================================================================
+
+class BlackScholesGreeks(NamedTuple):
+    """Price and Greeks from black_scholes_all (same units as the single functions)."""
+    price: object
+    delta: object
+    gamma: object
+    vega: object
+    theta: object
+
+
+def black_scholes_all(S, K, T, r, q, sigma, is_call, out=None) -> BlackScholesGreeks:
+    """
+    Price, delta, gamma, vega and theta in one pass.
+
+    d1, d2, sqrt(T), both discount factors, n(d1), N(w * d1) and N(w * d2)
+    are evaluated once and shared, instead of once per black_scholes_* call.
+    Results match the single functions, including at expiry.
+
+    ``out`` is an optional float64 array of shape (5, *broadcast shape); the
+    price and the four Greeks are written into its rows (in field order) and
+    the returned tuple holds views of those rows.
+    """
+    S, K, T, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, sigma))
+    omega = _omega(is_call)
+    rows = (None,) * 5 if out is None else tuple(out)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1, d2, sqrt_t = _d1_d2(S, K, T, r, q, sigma)
+        df_q = np.exp(-q * T)
+        disc_spot = S * df_q
+        disc_strike = K * np.exp(-r * T)
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+        cdf_d1 = ndtr(omega * d1)
+        cdf_d2 = ndtr(omega * d2)
+
+        price = np.multiply(omega, disc_spot * cdf_d1 - disc_strike * cdf_d2, out=rows[0])
+        delta = np.multiply(omega * df_q, cdf_d1, out=rows[1])
+        gamma = np.divide(df_q * pdf_d1, S * sigma * sqrt_t, out=rows[2])
+        vega = np.multiply(disc_spot * pdf_d1, sqrt_t, out=rows[3])
+        decay = -disc_spot * pdf_d1 * sigma / (2.0 * sqrt_t)
+        carry = r * disc_strike * cdf_d2 - q * disc_spot * cdf_d1
+        theta = np.subtract(decay, omega * carry, out=rows[4])
+
+    greeks = [price, delta, gamma, vega, theta]
+    expired = _expired_mask(T)
+    if expired is not None:
+        expired_values = (
+            np.maximum(omega * (S - K), 0.0), _expired_delta(S, K, omega), 0.0, 0.0, 0.0
+        )
+        greeks = [_at_expiry(x, expired, v, o) for x, v, o in zip(greeks, expired_values, rows)]
+    if out is None:
+        greeks = [_result(x) for x in greeks]
+    return BlackScholesGreeks(*greeks)
+
+
+# ============================================================================
+# Implied volatility
+# ============================================================================
+
+def black_scholes_implied_vol(price, S, K, T, r, q, is_call, tol: float = 1e-8, max_iter: int = 32):
+    """
+    Invert Black-Scholes prices to implied volatilities.
+
+    The quote-level invariants (sqrt(T), S * exp(-qT), K * exp(-rT) and their
+    log ratio) are computed once; each Newton iteration only re-evaluates d1,
+    d2, the two CDFs and vega. Newton starts at the inflection point
+    sqrt(2 |log(F / K)| / T) and bisects whenever a step leaves the current
+    [lo, hi] bracket. Uses the compiled kernel when numba is installed.
+
+    Args:
+        price: Market option price(s)
+        S: Spot price(s)
+        K: Strike price(s)
+        T: Time(s) to maturity in years
+        r: Risk-free rate(s)
+        q: Dividend yield(s)
+        is_call: True for calls, False for puts (scalar or array)
+        tol: Volatility tolerance on the Newton step
+        max_iter: Maximum number of Newton iterations
+
+    Returns:
+        Implied volatility(ies); NaN outside the no-arbitrage bounds, at
+        expiry, or where the solver did not converge.
+    """
+    if _bs_implied_vol_ufunc is not None:
+        return _result(_bs_implied_vol_ufunc(
+            price, S, K, T, r, q, np.asarray(is_call, dtype=bool), tol, max_iter
+        ))
+
+    price, S, K, T, r, q = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (price, S, K, T, r, q))
+    )
+    omega = np.broadcast_to(_omega(is_call), price.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_t = np.sqrt(T)
+        disc_spot = S * np.exp(-q * T)
+        disc_strike = K * np.exp(-r * T)
+        log_fk = np.log(disc_spot / disc_strike)
+        lower = np.maximum(omega * (disc_spot - disc_strike), 0.0)
+        upper = np.where(omega > 0, disc_spot, disc_strike)
+        valid = (T > 0) & (S > 0) & (K > 0) & (price > lower) & (price < upper)
+
+        abs_log_fk = np.abs(log_fk)
+        sigma = np.where(abs_log_fk > 1e-6, np.sqrt(2.0 * abs_log_fk / T), 0.2)
+        sigma = np.clip(sigma, 2.0 * _SIGMA_LO, 0.5 * _SIGMA_HI)
+        lo = np.full(price.shape, _SIGMA_LO)
+        hi = np.full(price.shape, _SIGMA_HI)
+        converged = ~valid
+
+        for _ in range(max_iter):
+            total_vol = sigma * sqrt_t
+            d1 = log_fk / total_vol + 0.5 * total_vol
+            d2 = d1 - total_vol
+            diff = omega * (disc_spot * ndtr(omega * d1) - disc_strike * ndtr(omega * d2)) - price
+            vega = disc_spot * np.exp(-0.5 * d1 * d1) * INV_SQRT_2PI * sqrt_t
+
+            converged = converged | (np.abs(diff) < tol * vega)
+            if converged.all():
+                break
+
+            hi = np.where(diff > 0, sigma, hi)
+            lo = np.where(diff < 0, sigma, lo)
+            collapsed = ~converged & (hi - lo < tol)
+            step = sigma - diff / vega
+            step = np.where((vega > 1e-12) & (step > lo) & (step < hi), step, 0.5 * (lo + hi))
+            sigma = np.where(converged, sigma, np.where(collapsed, 0.5 * (lo + hi), step))
+            converged = converged | collapsed
+
+    return _result(np.where(valid & converged, sigma, np.nan))
@@ -0,0 +1,90 @@
+"""
+Option Book
+
+Struct-of-arrays container for a book of European options, laid out for the
+vectorized Black-Scholes functions: one contiguous float64 array per input
+instead of a list of option objects read field by field.
+
+author: Yunian Pan
+email: yp1170@nyu.edu
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .black_scholes import black_scholes_all, black_scholes_price, BlackScholesGreeks
+
+
+@dataclass
+class OptionBook:
+    """
+    Aligned per-option arrays (one entry per option).
+
+    Attributes:
+        spot: Spot price of the underlying
+        strike: Strike price
+        T: Time to maturity in years
+        vol: Volatility
+        q: Dividend yield
+        is_call: True for calls, False for puts
+    """
+    spot: np.ndarray
+    strike: np.ndarray
+    T: np.ndarray
+    vol: np.ndarray
+    q: np.ndarray
+    is_call: np.ndarray
+
+    @classmethod
+    def from_options(cls,
+                     options: Sequence,
+                     spot,
+                     vol,
+                     q=0.0) -> "OptionBook":
+        """
+        Build a book from derivative contracts.
+
+        The five float fields are rows of a single (5, n) allocation, so each
+        field is a contiguous view.
+
+        Args:
+            options: Contracts with ``strike``, ``maturity`` and a call/put
+                ``contract_type`` (e.g. EuropeanCall, EuropeanPut)
+            spot: Spot price, scalar or one per option
+            vol: Volatility, scalar or one per option
+            q: Dividend yield, scalar or one per option
+
+        Returns:
+            OptionBook
+        """
+        n = len(options)
+        data = np.empty((5, n), dtype=np.float64)
+        data[0] = spot
+        data[1] = [opt.strike for opt in options]
+        data[2] = [opt.maturity for opt in options]
+        data[3] = vol
+        data[4] = q
+        is_call = np.fromiter(
+            (opt.contract_type.endswith("call") for opt in options), dtype=bool, count=n
+        )
+        return cls(spot=data[0], strike=data[1], T=data[2], vol=data[3], q=data[4],
+                   is_call=is_call)
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    def price(self, r: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Black-Scholes price of every option in the book (into ``out`` when given)."""
+        return black_scholes_price(self.spot, self.strike, self.T, r, self.q, self.vol,
+                                   self.is_call, out=out)
+
+    def greeks(self, r: float, out: Optional[np.ndarray] = None) -> BlackScholesGreeks:
+        """
+        Price, delta, gamma, vega and theta of every option in one pass.
+
+        ``out`` is an optional (5, n) buffer, see black_scholes_all.
+        """
+        return black_scholes_all(self.spot, self.strike, self.T, r, self.q, self.vol,
+                                 self.is_call, out=out)
@@ -3,22 +3,34 @@ Configuration loading utilities.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
+# LibYAML's C parser when PyYAML was built with it, the pure-Python one otherwise
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
+
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """Get the project root directory."""
     # Assuming this file is in src/options_desk/utils/
     return Path(__file__).parent.parent.parent.parent
 
 
+@lru_cache(maxsize=32)
 def load_config(config_name: str) -> Dict[str, Any]:
     """
     Load a configuration file from the config directory.
 
+    Each file is read and parsed once per process; later calls return the
+    same dictionary, so callers must not mutate it (copy it first).
+
     Args:
         config_name: Name of the config file (without .yaml extension)
 
@@ -34,7 +46,7 @@ def load_config(config_name: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_SafeLoader)
 
     return config
 
@@ -0,0 +1,31 @@
+"""
+scipy.stats reference values shared by the Black-Scholes kernel and pricer tests
+"""
+import numpy as np
+from scipy.stats import norm
+
+
+def bs_reference(S, K, T, r, q, sigma, is_call):
+    """Price, delta, gamma, vega and theta (per year) via scipy.stats.norm."""
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    w = 1.0 if is_call else -1.0
+    price = w * (S * np.exp(-q * T) * norm.cdf(w * d1) - K * np.exp(-r * T) * norm.cdf(w * d2))
+    delta = w * np.exp(-q * T) * norm.cdf(w * d1)
+    gamma = np.exp(-q * T) * norm.pdf(d1) / (S * sigma * np.sqrt(T))
+    vega = S * np.exp(-q * T) * norm.pdf(d1) * np.sqrt(T)
+    theta = (
+        -S * np.exp(-q * T) * norm.pdf(d1) * sigma / (2 * np.sqrt(T))
+        - w * r * K * np.exp(-r * T) * norm.cdf(w * d2)
+        + w * q * S * np.exp(-q * T) * norm.cdf(w * d1)
+    )
+    return price, delta, gamma, vega, theta
+
+
+# ATM, deep wings and a very short expiry where polynomial CDF approximations drift
+BS_CASES = [
+    (100.0, 100.0, 1.0, 0.05, 0.0, 0.2),
+    (100.0, 60.0, 0.5, 0.03, 0.02, 0.35),
+    (100.0, 180.0, 2.0, 0.05, 0.01, 0.25),
+    (100.0, 100.0, 1.0 / 365.0, 0.05, 0.0, 0.15),
+]
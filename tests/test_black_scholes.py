@@ -0,0 +1,156 @@
+"""
+Test the vectorized Black-Scholes pricer against BlackScholesPricer's formulas
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from options_desk.pricer.black_scholes import (
+    black_scholes_price,
+    black_scholes_price_slice,
+    black_scholes_delta,
+    black_scholes_gamma,
+    black_scholes_vega,
+    black_scholes_theta,
+    black_scholes_all,
+    black_scholes_implied_vol,
+)
+import options_desk.pricer.black_scholes as bs_module
+from options_desk.pricer.book import OptionBook
+from options_desk.derivatives import EuropeanCall, EuropeanPut
+from bs_reference import bs_reference, BS_CASES
+
+
+@pytest.mark.parametrize("S,K,T,r,q,sigma", BS_CASES)
+@pytest.mark.parametrize("is_call", [True, False])
+def test_scalar_matches_reference(S, K, T, r, q, sigma, is_call):
+    ref = bs_reference(S, K, T, r, q, sigma, is_call)
+    got = (
+        black_scholes_price(S, K, T, r, q, sigma, is_call),
+        black_scholes_delta(S, K, T, r, q, sigma, is_call),
+        black_scholes_gamma(S, K, T, r, q, sigma),
+        black_scholes_vega(S, K, T, r, q, sigma),
+        black_scholes_theta(S, K, T, r, q, sigma, is_call),
+    )
+    for value, expected in zip(got, ref):
+        assert isinstance(value, float)
+        assert value == pytest.approx(expected, rel=1e-10, abs=1e-12)
+
+
+def test_book_matches_scalar():
+    rng = np.random.default_rng(0)
+    n = 200
+    S = rng.uniform(50.0, 150.0, n)
+    K = rng.uniform(50.0, 150.0, n)
+    T = rng.uniform(0.01, 3.0, n)
+    sigma = rng.uniform(0.05, 0.8, n)
+    is_call = rng.random(n) < 0.5
+    r, q = 0.04, 0.01
+
+    prices = black_scholes_price(S, K, T, r, q, sigma, is_call)
+    deltas = black_scholes_delta(S, K, T, r, q, sigma, is_call)
+    thetas = black_scholes_theta(S, K, T, r, q, sigma, is_call)
+    assert prices.shape == (n,)
+    for i in range(n):
+        args = (S[i], K[i], T[i], r, q, sigma[i], bool(is_call[i]))
+        assert prices[i] == pytest.approx(black_scholes_price(*args), rel=1e-14, abs=1e-14)
+        assert deltas[i] == pytest.approx(black_scholes_delta(*args), rel=1e-14, abs=1e-14)
+        assert thetas[i] == pytest.approx(black_scholes_theta(*args), rel=1e-14, abs=1e-14)
+
+
+def test_expired_options_pay_intrinsic():
+    K = np.array([90.0, 100.0, 110.0])
+    args = (100.0, K, 0.0, 0.05, 0.0, 0.2)
+    np.testing.assert_allclose(black_scholes_price(*args, True), [10.0, 0.0, 0.0])
+    np.testing.assert_allclose(black_scholes_price(*args, False), [0.0, 0.0, 10.0])
+    np.testing.assert_allclose(black_scholes_delta(*args, True), [1.0, 0.0, 0.0])
+    np.testing.assert_allclose(black_scholes_gamma(*args), 0.0)
+
+
+def test_fused_matches_single_functions():
+    S = 100.0
+    K = np.array([60.0, 95.0, 100.0, 105.0, 150.0, 100.0])
+    T = np.array([0.5, 1.0, 1.0 / 365.0, 2.0, 0.25, 0.0])
+    is_call = np.array([True, False, True, False, True, False])
+    r, q, sigma = 0.04, 0.015, 0.3
+
+    args = (S, K, T, r, q, sigma)
+    fused = black_scholes_all(*args, is_call)
+    np.testing.assert_allclose(fused.price, black_scholes_price(*args, is_call), rtol=1e-14)
+    np.testing.assert_allclose(fused.delta, black_scholes_delta(*args, is_call), rtol=1e-14)
+    np.testing.assert_allclose(fused.gamma, black_scholes_gamma(*args), rtol=1e-14)
+    np.testing.assert_allclose(fused.vega, black_scholes_vega(*args), rtol=1e-14)
+    np.testing.assert_allclose(fused.theta, black_scholes_theta(*args, is_call), rtol=1e-14)
+
+
+@pytest.mark.parametrize("T", [0.0, 1.0 / 365.0, 0.75])
+def test_slice_matches_book(T):
+    strikes = np.linspace(60.0, 160.0, 21)
+    option_types = np.where(np.arange(21) % 2 == 0, 'call', 'put')
+    smile = 0.2 + 0.1 * (np.log(strikes / 100.0)) ** 2
+
+    prices = black_scholes_price_slice(100.0, strikes, T, 0.03, 0.01, smile, option_types)
+    expected = black_scholes_price(100.0, strikes, T, 0.03, 0.01, smile, option_types == 'call')
+    np.testing.assert_allclose(prices, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_option_book_from_options():
+    options = [EuropeanCall(90.0, 0.5), EuropeanPut(100.0, 1.0), EuropeanCall(120.0, 2.0)]
+    book = OptionBook.from_options(options, spot=100.0, vol=np.array([0.25, 0.2, 0.3]), q=0.01)
+
+    assert len(book) == 3
+    np.testing.assert_array_equal(book.is_call, [True, False, True])
+    assert all(a.flags.c_contiguous for a in (book.spot, book.strike, book.T, book.vol, book.q))
+
+    greeks = book.greeks(0.03)
+    expected = black_scholes_all(100.0, book.strike, book.T, 0.03, 0.01, book.vol, book.is_call)
+    for got, ref in zip(greeks, expected):
+        np.testing.assert_allclose(got, ref, rtol=1e-14)
+    np.testing.assert_allclose(book.price(0.03), expected.price, rtol=1e-14)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_implied_vol_round_trip(compiled, monkeypatch):
+    if not compiled:
+        monkeypatch.setattr(bs_module, "_bs_implied_vol_ufunc", None)
+    K = np.array([50.0, 80.0, 100.0, 100.0, 120.0, 200.0])
+    T = np.array([0.25, 1.0, 1.0 / 365.0, 2.0, 0.5, 1.5])
+    sigma = np.array([0.6, 0.3, 0.2, 0.15, 0.45, 0.35])
+    is_call = np.array([False, True, True, False, True, True])
+    prices = black_scholes_price(100.0, K, T, 0.03, 0.01, sigma, is_call)
+
+    ivs = black_scholes_implied_vol(prices, 100.0, K, T, 0.03, 0.01, is_call, tol=1e-12)
+    np.testing.assert_allclose(ivs, sigma, rtol=1e-6)
+
+    # Below intrinsic, above the forward bound, and expired quotes have no implied vol
+    bad = black_scholes_implied_vol(
+        np.array([1.0, 150.0, 5.0]), 100.0, np.array([80.0, 100.0, 100.0]),
+        np.array([1.0, 1.0, 0.0]), 0.03, 0.01, True,
+    )
+    assert np.isnan(bad).all()
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_out_buffers(compiled, monkeypatch):
+    if not compiled:
+        monkeypatch.setattr(bs_module, "_bs_price_ufunc", None)
+        monkeypatch.setattr(bs_module, "_bs_price_scalar", None)
+    K = np.array([60.0, 95.0, 100.0, 105.0, 150.0, 100.0])
+    T = np.array([0.5, 1.0, 1.0 / 365.0, 2.0, 0.25, 0.0])
+    is_call = np.array([True, False, True, False, True, False])
+    args = (100.0, K, T, 0.04, 0.015, 0.3, is_call)
+
+    out = np.full(K.shape, np.nan)
+    assert black_scholes_price(*args, out=out) is out
+    np.testing.assert_allclose(out, black_scholes_price(*args), rtol=1e-14)
+
+    buffer = np.full((5, K.size), np.nan)
+    fused = black_scholes_all(*args, out=buffer)
+    assert all(np.shares_memory(x, buffer) for x in fused)
+    for row, expected in zip(buffer, black_scholes_all(*args)):
+        np.testing.assert_allclose(row, expected, rtol=1e-14)
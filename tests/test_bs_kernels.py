@@ -0,0 +1,52 @@
+"""
+Test compiled Black-Scholes kernels used by the pricing endpoints
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add repo root and src to path (the backend kernels import options_desk)
+root_path = str(Path(__file__).parent.parent)
+for path in (root_path, str(Path(root_path) / "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from backend.services.bs_kernels import bs_price, bs_greeks, specialize
+from bs_reference import bs_reference, BS_CASES
+
+
+@pytest.mark.parametrize("S,K,T,r,q,sigma", BS_CASES)
+@pytest.mark.parametrize("is_call", [True, False])
+def test_kernels_match_scipy(S, K, T, r, q, sigma, is_call):
+    price_ref, delta_ref, gamma_ref, _, _ = bs_reference(S, K, T, r, q, sigma, is_call)
+
+    price = bs_price(S, K, T, r, q, sigma, is_call)
+    delta, gamma, vega, theta, rho = bs_greeks(S, K, T, r, q, sigma, is_call)
+
+    assert price == pytest.approx(price_ref, rel=1e-10, abs=1e-12)
+    assert delta == pytest.approx(delta_ref, rel=1e-10, abs=1e-12)
+    assert gamma == pytest.approx(gamma_ref, rel=1e-10, abs=1e-12)
+    assert vega > 0
+
+
+def test_put_call_parity():
+    S, K, T, r, q, sigma = 100.0, 105.0, 0.75, 0.04, 0.01, 0.3
+    call = bs_price(S, K, T, r, q, sigma, True)
+    put = bs_price(S, K, T, r, q, sigma, False)
+    assert call - put == pytest.approx(S * np.exp(-q * T) - K * np.exp(-r * T), rel=1e-10)
+
+
+def test_specialized_kernels_match_general():
+    price_default, greeks_default = specialize(0.05, 0.0)
+    for S, K, T, r, q, sigma in BS_CASES:
+        for is_call in (True, False):
+            assert price_default(S, K, T, sigma, is_call) == pytest.approx(
+                bs_price(S, K, T, 0.05, 0.0, sigma, is_call), rel=1e-12, abs=1e-14
+            )
+            np.testing.assert_allclose(
+                greeks_default(S, K, T, sigma, is_call),
+                bs_greeks(S, K, T, 0.05, 0.0, sigma, is_call),
+                rtol=1e-12, atol=1e-14,
+            )